@@ -17,6 +17,15 @@ export const config = {
     // Connection retry settings
     ROVER_RECONNECT_DELAY: 5000,
 
+    // Rover link liveness: the socket is dropped if no data arrives within this window
+    // (rover streams telemetry continuously), and TCP keepalive probes start after the delay
+    ROVER_CONNECT_TIMEOUT: 5000,
+    ROVER_IDLE_TIMEOUT: 10000,
+    ROVER_KEEPALIVE_DELAY: 5000,
+
+    // Log every command sent to the rover (noisy: manual control sends at 20 Hz)
+    LOG_COMMANDS: process.env.LOG_COMMANDS === '1',
+
     // CORS origins (frontend URL)
     CORS_ORIGIN: process.env.CORS_ORIGIN || 'http://localhost:5173',
 };
@@ -10,12 +10,22 @@
 import express from 'express';
 import cors from 'cors';
 import { createServer } from 'http';
+import { isIP } from 'net';
 import { Server } from 'socket.io';
 
 import { config } from './config.js';
 import { RoverConnection } from './roverConnection.js';
 import { VehicleStore } from './vehicleStore.js';
 import { setupSocketHandlers } from './socketHandlers.js';
+import { VehicleState } from './types.js';
+
+// RFC 1123 hostname (e.g. rover.local via mDNS, or a DHCP name): dot-separated labels of
+// letters, digits and inner hyphens, at most 63 chars each and 253 overall
+const HOSTNAME_PATTERN = /^(?=.{1,253}$)[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?(?:\.[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?)*\.?$/i;
+
+function isValidHost(host: unknown): host is string {
+    return typeof host === 'string' && (isIP(host) !== 0 || HOSTNAME_PATTERN.test(host));
+}
 
 // Initialize Express app
 const app = express();
@@ -42,32 +52,60 @@ let roverConnection = new RoverConnection(config.ROVER_HOST, config.ROVER_PORT);
 // Setup Socket.IO event handlers
 setupSocketHandlers(io, vehicleStore, () => roverConnection);
 
-// Rover connection event handlers
-roverConnection.on('connected', () => {
-    vehicleStore.setConnected(true);
-    io.emit('connection:status', { connected: true });
-});
+// Rover connection event handlers.
+// Defined once and attached in one place, so every (re)created connection shares them.
+function onRoverConnected(): void {
+    if (vehicleStore.setConnected(true)) {
+        io.emit('connection:status', { connected: true });
+    }
+    console.log('[Main] Rover connected successfully');
+}
 
-roverConnection.on('disconnected', () => {
-    vehicleStore.setConnected(false);
-    io.emit('connection:status', { connected: false });
-});
+function onRoverDisconnected(): void {
+    if (vehicleStore.setConnected(false)) {
+        io.emit('connection:status', { connected: false });
+    }
+}
 
-roverConnection.on('telemetry', (partialState) => {
+function onRoverTelemetry(partialState: Partial<VehicleState>): void {
     vehicleStore.update(partialState);
-});
+}
 
-roverConnection.on('error', (error) => {
+function onRoverError(error: Error): void {
     console.error('[Main] Rover connection error:', error.message);
-});
-
-// Broadcast state to all connected clients at regular interval (only if changed)
-setInterval(() => {
-    if (vehicleStore.isDirty) {
+}
+
+function attachRoverHandlers(connection: RoverConnection): void {
+    connection
+        .on('connected', onRoverConnected)
+        .on('disconnected', onRoverDisconnected)
+        .on('telemetry', onRoverTelemetry)
+        .on('error', onRoverError);
+}
+
+attachRoverHandlers(roverConnection);
+
+// Broadcast state to all connected clients when it changes, at most once per
+// TELEMETRY_BROADCAST_INTERVAL. A one-shot timer is armed by the first change after
+// a broadcast, so an idle rover causes no wakeups.
+// With no clients attached the state stays dirty; new clients get it on connect.
+let broadcastTimer: NodeJS.Timeout | null = null;
+let lastBroadcastTime = 0;
+
+function broadcastState(): void {
+    broadcastTimer = null;
+    if (vehicleStore.isDirty && io.engine.clientsCount > 0) {
         io.emit('state', vehicleStore.getState());
         vehicleStore.clearDirty();
+        lastBroadcastTime = Date.now();
     }
-}, config.TELEMETRY_BROADCAST_INTERVAL);
+}
+
+vehicleStore.onChange(() => {
+    if (broadcastTimer) return;
+    const delay = Math.max(0, lastBroadcastTime + config.TELEMETRY_BROADCAST_INTERVAL - Date.now());
+    broadcastTimer = setTimeout(broadcastState, delay);
+});
 
 // Health check endpoint
 app.get('/health', (req, res) => {
@@ -95,31 +133,29 @@ app.post('/rover/connect', (req, res) => {
         });
     }
 
+    // Native address parse instead of hand-splitting octets; accepts IPv4, IPv6 and hostnames
+    const portNum = Number(port);
+    if (!isValidHost(host)) {
+        return res.status(400).json({
+            success: false,
+            message: 'Host must be a valid IP address or hostname'
+        });
+    }
+    if (!Number.isInteger(portNum) || portNum < 1 || portNum > 65535) {
+        return res.status(400).json({
+            success: false,
+            message: 'Port must be an integer between 1 and 65535'
+        });
+    }
+
     // Disconnect old connection
     roverConnection.disconnect();
 
     // Create new connection
-    roverConnection = new RoverConnection(host, parseInt(port, 10));
+    roverConnection = new RoverConnection(host, portNum);
 
     // Set up event handlers for new connection
-    roverConnection.on('connected', () => {
-        vehicleStore.setConnected(true);
-        io.emit('connection:status', { connected: true });
-        console.log('[Main] Rover connected successfully');
-    });
-
-    roverConnection.on('disconnected', () => {
-        vehicleStore.setConnected(false);
-        io.emit('connection:status', { connected: false });
-    });
-
-    roverConnection.on('telemetry', (partialState) => {
-        vehicleStore.update(partialState);
-    });
-
-    roverConnection.on('error', (error) => {
-        console.error('[Main] Rover connection error:', error.message);
-    });
+    attachRoverHandlers(roverConnection);
 
     // Attempt connection
     roverConnection.connect();
@@ -0,0 +1,114 @@
+/**
+ * Mission Helpers
+ *
+ * Validation and path planning of mission waypoints before they are sent to the rover.
+ * OPTIMIZED: Whole batch is validated and segmented in single passes instead of per-waypoint calls
+ */
+
+import { Waypoint } from './types.js';
+
+const EARTH_RADIUS_M = 6371000;
+const DEG_TO_RAD = Math.PI / 180;
+const RAD_TO_DEG = 180 / Math.PI;
+
+// Mission ids: prefix formatted once per process, then a plain counter per mission.
+// The base-36 start time keeps ids unique across backend restarts and short enough
+// for the rover's fixed-size mission id buffer.
+const MISSION_ID_PREFIX = `mission_${Date.now().toString(36)}_`;
+let missionCounter = 0;
+
+/** Path segment in the ESP32 mission protocol format */
+export interface PathSegment {
+    start_lat: number;
+    start_lon: number;
+    end_lat: number;
+    end_lon: number;
+    distance: number; // meters
+    bearing: number;  // degrees (0-360)
+    speed: number;    // m/s
+}
+
+/**
+ * Validate a batch of waypoints in one sweep.
+ * Returns an error message for the first invalid entry, or null if the batch is valid.
+ */
+export function validateWaypoints(waypoints: unknown): string | null {
+    if (!Array.isArray(waypoints)) {
+        return 'Waypoints must be an array';
+    }
+
+    for (let i = 0; i < waypoints.length; i++) {
+        const wp = waypoints[i] as Waypoint;
+        const lat = wp?.lat;
+        const lng = wp?.lng;
+
+        // Number.isFinite rejects non-numbers, NaN and Infinity in one check
+        if (!Number.isFinite(lat) || !Number.isFinite(lng) ||
+            lat < -90 || lat > 90 || lng < -180 || lng > 180) {
+            return `Invalid coordinates for waypoint ${i + 1}`;
+        }
+    }
+
+    return null;
+}
+
+/**
+ * Generate a unique id for a new mission upload
+ */
+export function createMissionId(): string {
+    return MISSION_ID_PREFIX + (++missionCounter).toString(36);
+}
+
+/**
+ * Build all path segments for a mission in one pass (haversine distance + initial bearing).
+ * Each waypoint's radians, sin and cos are computed once and reused by both adjacent segments.
+ */
+export function buildPathSegments(waypoints: Waypoint[], speedMps: number): { segments: PathSegment[]; totalDistance: number } {
+    const segments: PathSegment[] = [];
+    let totalDistance = 0;
+
+    if (waypoints.length < 2) {
+        return { segments, totalDistance };
+    }
+
+    let prev = waypoints[0];
+    let lat1 = prev.lat * DEG_TO_RAD;
+    let sinLat1 = Math.sin(lat1);
+    let cosLat1 = Math.cos(lat1);
+
+    for (let i = 1; i < waypoints.length; i++) {
+        const next = waypoints[i];
+        const lat2 = next.lat * DEG_TO_RAD;
+        const sinLat2 = Math.sin(lat2);
+        const cosLat2 = Math.cos(lat2);
+        const dLon = (next.lng - prev.lng) * DEG_TO_RAD;
+        const sinHalfDLat = Math.sin((lat2 - lat1) / 2);
+        const sinHalfDLon = Math.sin(dLon / 2);
+
+        const a = sinHalfDLat * sinHalfDLat + cosLat1 * cosLat2 * sinHalfDLon * sinHalfDLon;
+        const distance = 2 * EARTH_RADIUS_M * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
+
+        const y = Math.sin(dLon) * cosLat2;
+        const x = cosLat1 * sinLat2 - sinLat1 * cosLat2 * Math.cos(dLon);
+        const bearing = (Math.atan2(y, x) * RAD_TO_DEG + 360) % 360;
+
+        segments.push({
+            start_lat: prev.lat,
+            start_lon: prev.lng,
+            end_lat: next.lat,
+            end_lon: next.lng,
+            distance,
+            bearing,
+            speed: speedMps,
+        });
+        totalDistance += distance;
+
+        // Next segment starts where this one ends
+        prev = next;
+        lat1 = lat2;
+        sinLat1 = sinLat2;
+        cosLat1 = cosLat2;
+    }
+
+    return { segments, totalDistance };
+}
@@ -9,7 +9,7 @@
 import * as net from 'net';
 import { EventEmitter } from 'events';
 import { config } from './config.js';
-import { VehicleState, createInitialVehicleState } from './types.js';
+import { VehicleState, IMUCalibration, createInitialVehicleState } from './types.js';
 
 export interface RoverConnectionEvents {
     connected: () => void;
@@ -18,6 +18,41 @@ export interface RoverConnectionEvents {
     error: (error: Error) => void;
 }
 
+// Shared defaults for missing IMU vectors (never mutated downstream)
+const IDENTITY_QUATERNION: [number, number, number, number] = [1, 0, 0, 0];
+const ZERO_VECTOR: [number, number, number] = [0, 0, 0];
+const DEFAULT_GRAVITY: [number, number, number] = [0, 0, 9.8];
+Object.freeze(IDENTITY_QUATERNION);
+Object.freeze(ZERO_VECTOR);
+Object.freeze(DEFAULT_GRAVITY);
+
+// Typed field extractor: a malformed (non-numeric) field falls back to the default
+// instead of reaching the UI, with no exception path involved.
+function num(value: unknown, fallback: number): number {
+    return typeof value === 'number' ? value : fallback;
+}
+
+// BNO055 calibration levels are 0-3 each, so there are only 256 distinct statuses.
+// Share one frozen object per status instead of allocating one per packet.
+const calibrationCache = new Map<number, IMUCalibration>();
+
+function getCalibration(sys: number, gyro: number, accel: number, mag: number): IMUCalibration {
+    // Out-of-range or non-integer levels are not cached
+    if (!Number.isInteger(sys) || !Number.isInteger(gyro) ||
+        !Number.isInteger(accel) || !Number.isInteger(mag) ||
+        ((sys | gyro | accel | mag) & ~3) !== 0) {
+        return { system: sys, gyroscope: gyro, accelerometer: accel, magnetometer: mag };
+    }
+
+    const key = (sys << 6) | (gyro << 4) | (accel << 2) | mag;
+    let calibration = calibrationCache.get(key);
+    if (!calibration) {
+        calibration = Object.freeze({ system: sys, gyroscope: gyro, accelerometer: accel, magnetometer: mag });
+        calibrationCache.set(key, calibration);
+    }
+    return calibration;
+}
+
 export class RoverConnection extends EventEmitter {
     private socket: net.Socket | null = null;
     private reconnectTimer: NodeJS.Timeout | null = null;
@@ -46,20 +81,36 @@ export class RoverConnection extends EventEmitter {
         console.log(`[RoverConnection] Connecting to ${this.host}:${this.port}...`);
 
         this.socket = new net.Socket();
+        // Decode as UTF-8 at the stream level (handles multi-byte chars split across chunks)
+        this.socket.setEncoding('utf8');
+        // Bound the TCP handshake: an unreachable host would otherwise hang until the OS gives up
+        this.socket.setTimeout(config.ROVER_CONNECT_TIMEOUT);
 
         this.socket.connect(this.port, this.host, () => {
             console.log('[RoverConnection] Connected to rover');
             // CRITICAL: Disable Nagle's algorithm to ensure commands are sent immediately
             // Without this, small packets (like stop commands) may be buffered
             this.socket!.setNoDelay(true);
+            // Event-driven liveness: the kernel/stream raises 'timeout' on a silent link,
+            // no polling timer is needed to notice a dead rover
+            this.socket!.setKeepAlive(true, config.ROVER_KEEPALIVE_DELAY);
+            this.socket!.setTimeout(config.ROVER_IDLE_TIMEOUT);
             this._isConnected = true;
             this.emit('connected');
         });
 
-        this.socket.on('data', (data: Buffer) => {
+        this.socket.on('data', (data: string) => {
             this.handleData(data);
         });
 
+        this.socket.on('timeout', () => {
+            console.warn(this._isConnected
+                ? '[RoverConnection] No data from rover, dropping connection'
+                : '[RoverConnection] Connection attempt timed out');
+            // destroy() triggers 'close', which handles state and reconnection
+            this.socket?.destroy();
+        });
+
         this.socket.on('close', () => {
             console.log('[RoverConnection] Connection closed');
             this._isConnected = false;
@@ -95,20 +146,27 @@ export class RoverConnection extends EventEmitter {
      * AGGRESSIVE FLUSH: cork → write → immediate uncork
      */
     sendCommand(command: object): boolean {
+        return this.sendRaw(JSON.stringify(command));
+    }
+
+    /**
+     * Send an already-serialized JSON command (without trailing newline)
+     */
+    sendRaw(command: string): boolean {
         if (!this.socket || !this._isConnected) {
             console.warn('[RoverConnection] Cannot send command: not connected');
             return false;
         }
 
         try {
-            const json = JSON.stringify(command) + '\n';
-
             // AGGRESSIVE FLUSH STRATEGY:
             // 1. Cork to batch (prevents partial writes)
-            // 2. Write the data
+            // 2. Write the payload and its newline terminator as separate chunks
+            //    (no concatenated copy of large mission payloads; cork sends them together)
             // 3. Immediately uncork with setImmediate to flush on next I/O cycle
             this.socket.cork();
-            this.socket.write(json, 'utf8');
+            this.socket.write(command, 'utf8');
+            this.socket.write('\n', 'utf8');
 
             // setImmediate runs before any I/O callbacks, forcing immediate flush
             setImmediate(() => {
@@ -117,7 +175,9 @@ export class RoverConnection extends EventEmitter {
                 }
             });
 
-            console.log('[RoverConnection] Sent:', json.trim());
+            if (config.LOG_COMMANDS) {
+                console.log('[RoverConnection] Sent:', command);
+            }
             return true;
         } catch (err) {
             console.error('[RoverConnection] Failed to send command:', err);
@@ -127,112 +187,140 @@ export class RoverConnection extends EventEmitter {
 
     /**
      * Handle incoming data (JSON lines)
+     * Splits each chunk once instead of re-slicing the remaining buffer per line.
+     * All frames in a chunk are merged into a single 'telemetry' event (newest field wins).
      */
-    private handleData(data: Buffer): void {
-        this.buffer += data.toString();
+    private handleData(data: string): void {
+        const lines = (this.buffer + data).split('\n');
+
+        // Last element is the (possibly empty) incomplete line
+        this.buffer = lines.pop()!;
+
+        // One arrival timestamp for every line that came in with this chunk
+        const receivedAt = Date.now();
 
-        // Process complete lines
-        let newlineIndex: number;
-        while ((newlineIndex = this.buffer.indexOf('\n')) !== -1) {
-            const line = this.buffer.slice(0, newlineIndex).trim();
-            this.buffer = this.buffer.slice(newlineIndex + 1);
+        let merged: Partial<VehicleState> | null = null;
 
+        for (let i = 0; i < lines.length; i++) {
+            const line = lines[i].trim();
             if (line.length > 0) {
-                this.parseTelemetry(line);
+                const partialState = this.parseTelemetry(line, receivedAt);
+                if (partialState) {
+                    merged = merged ? Object.assign(merged, partialState) : partialState;
+                }
             }
         }
+
+        if (merged) {
+            this.emit('telemetry', merged);
+        }
     }
 
     /**
      * Parse JSON telemetry from rover
+     * @param receivedAt Arrival time of the data chunk the line came from
+     * @returns Partial state for the line, or null if it was not valid telemetry
      */
-    private parseTelemetry(json: string): void {
+    private parseTelemetry(json: string, receivedAt: number): Partial<VehicleState> | null {
+        // Fast pre-check: every rover message is a JSON object
+        if (json.charCodeAt(0) !== 0x7b /* '{' */) {
+            console.warn('[RoverConnection] Ignoring non-JSON line:', json.substring(0, 100));
+            return null;
+        }
+
+        // Only the parse itself can throw; field mapping below runs outside the try block
+        let data;
         try {
-            const data = JSON.parse(json);
+            data = JSON.parse(json);
+        } catch (err) {
+            console.warn('[RoverConnection] Failed to parse telemetry:', json.substring(0, 100));
+            return null;
+        }
 
-            // Map the ESP32 JSON format to our VehicleState
-            const partialState: Partial<VehicleState> = {
-                connected: true,
-                lastHeartbeat: Date.now(),
+        // Map the ESP32 JSON format to our VehicleState
+        const partialState: Partial<VehicleState> = {
+            connected: true,
+            lastHeartbeat: receivedAt,
+        };
+
+        // GPS
+        if (typeof data.lat === 'number' && typeof data.lon === 'number') {
+            partialState.gps = {
+                latitude: data.lat,
+                longitude: data.lon,
+                altitude: num(data.altitude, 0),
+                satellites: num(data.satellites, 0),
+                hdop: num(data.hdop, 0) || 99,
+                fix: data.lat !== 0 || data.lon !== 0,
             };
+        }
 
-            // GPS
-            if (data.lat !== undefined && data.lon !== undefined) {
-                partialState.gps = {
-                    latitude: data.lat,
-                    longitude: data.lon,
-                    altitude: data.altitude || 0,
-                    satellites: data.satellites || 0,
-                    hdop: data.hdop || 99,
-                    fix: data.lat !== 0 || data.lon !== 0,
-                };
-            }
-
-            // Attitude
-            if (data.heading !== undefined || data.imu_data) {
-                const imuData = data.imu_data || {};
-                partialState.attitude = {
-                    roll: imuData.roll || 0,
-                    pitch: imuData.pitch || 0,
-                    yaw: data.heading || 0,
-                };
-
-                // Full IMU data
-                if (data.imu_data) {
-                    partialState.imu = {
-                        roll: imuData.roll || 0,
-                        pitch: imuData.pitch || 0,
-                        quaternion: imuData.quaternion || [1, 0, 0, 0],
-                        accel: imuData.accel || [0, 0, 0],
-                        gyro: imuData.gyro || [0, 0, 0],
-                        mag: imuData.mag || [0, 0, 0],
-                        linearAccel: imuData.linear_accel || [0, 0, 0],
-                        gravity: imuData.gravity || [0, 0, 9.8],
-                        calibration: {
-                            system: imuData.calibration?.sys ?? 0,
-                            gyroscope: imuData.calibration?.gyro ?? 0,
-                            accelerometer: imuData.calibration?.accel ?? 0,
-                            magnetometer: imuData.calibration?.mag ?? 0,
-                        },
-                        temperature: imuData.temperature || data.temperature || 0,
-                    };
-                }
-            }
+        // Attitude
+        if (data.heading !== undefined || data.imu_data) {
+            const imuData = data.imu_data || {};
+            const roll = num(imuData.roll, 0);
+            const pitch = num(imuData.pitch, 0);
+            partialState.attitude = {
+                roll,
+                pitch,
+                yaw: num(data.heading, 0),
+            };
 
-            // System status
-            if (data.wifi_strength !== undefined) {
-                partialState.system = {
-                    batteryVoltage: data.battery || 0,
-                    wifiStrength: data.wifi_strength,
-                    mode: data.mode || 'IDLE',
-                    armed: data.armed || false,
-                    uptime: data.timestamp || 0,
+            // Full IMU data
+            if (data.imu_data) {
+                // Resolve the nested calibration object once instead of per field
+                const calib = imuData.calibration || {};
+                partialState.imu = {
+                    roll,
+                    pitch,
+                    quaternion: imuData.quaternion || IDENTITY_QUATERNION,
+                    accel: imuData.accel || ZERO_VECTOR,
+                    gyro: imuData.gyro || ZERO_VECTOR,
+                    mag: imuData.mag || ZERO_VECTOR,
+                    linearAccel: imuData.linear_accel || ZERO_VECTOR,
+                    gravity: imuData.gravity || DEFAULT_GRAVITY,
+                    calibration: getCalibration(
+                        calib.sys ?? 0,
+                        calib.gyro ?? 0,
+                        calib.accel ?? 0,
+                        calib.mag ?? 0,
+                    ),
+                    temperature: num(imuData.temperature, 0) || num(data.temperature, 0),
                 };
             }
+        }
 
-            // Sensor status
-            if (data.sensors) {
-                partialState.sensorStatus = {
-                    accel: data.sensors.accel ?? false,
-                    gyro: data.sensors.gyro ?? false,
-                    mag: data.sensors.mag ?? false,
-                    gps: data.sensors.gps ?? false,
-                    tof: data.sensors.tof ?? false,
-                };
-            }
+        // System status
+        if (typeof data.wifi_strength === 'number') {
+            partialState.system = {
+                batteryVoltage: num(data.battery, 0),
+                wifiStrength: data.wifi_strength,
+                mode: data.mode || 'IDLE',
+                armed: data.armed || false,
+                uptime: num(data.timestamp, 0),
+            };
+        }
 
-            // TOF data
-            if (data.tof_data) {
-                partialState.tofData = {
-                    distance: data.tof_data.distance || 0,
-                    status: data.tof_data.status || false,
-                };
-            }
+        // Sensor status
+        if (data.sensors) {
+            partialState.sensorStatus = {
+                accel: data.sensors.accel ?? false,
+                gyro: data.sensors.gyro ?? false,
+                mag: data.sensors.mag ?? false,
+                gps: data.sensors.gps ?? false,
+                tof: data.sensors.tof ?? false,
+            };
+        }
 
-            this.emit('telemetry', partialState);
-        } catch (err) {
-            console.warn('[RoverConnection] Failed to parse telemetry:', json.substring(0, 100));
+        // TOF data
+        if (data.tof_data) {
+            partialState.tofData = {
+                distance: num(data.tof_data.distance, 0),
+                status: data.tof_data.status || false,
+            };
         }
+
+        return partialState;
     }
 
     /**
@@ -8,6 +8,16 @@ import { Server, Socket } from 'socket.io';
 import { VehicleStore } from './vehicleStore.js';
 import { RoverConnection } from './roverConnection.js';
 import { Waypoint } from './types.js';
+import { validateWaypoints, buildPathSegments, createMissionId } from './mission.js';
+
+// Pre-serialized manual_move prefixes, one per direction accepted by the firmware.
+// Manual moves arrive at 20 Hz, so only the speed is formatted per command.
+const MANUAL_MOVE_PREFIX = new Map<string, string>(
+    [
+        'forward', 'backward', 'left', 'right', 'stop',
+        'forward_left', 'forward_right', 'backward_left', 'backward_right',
+    ].map(direction => [direction, `{"command":"manual_move","direction":"${direction}","speed":`])
+);
 
 export function setupSocketHandlers(
     io: Server,
@@ -22,22 +32,34 @@ export function setupSocketHandlers(
 
         // Handle mission upload
         socket.on('mission:upload', (waypoints: Waypoint[]) => {
+            const error = validateWaypoints(waypoints);
+            if (error) {
+                socket.emit('mission:uploaded', { success: false, error });
+                return;
+            }
+
             console.log(`[Socket] Mission upload: ${waypoints.length} waypoints`);
 
-            vehicleStore.setWaypoints(waypoints);
+            const speedMps = 1.0;
+            const { segments, totalDistance } = buildPathSegments(waypoints, speedMps);
+
+            vehicleStore.setWaypoints(waypoints, totalDistance);
 
             // Format waypoints for ESP32 - upload only, don't auto-start
             const command = {
                 command: 'upload_mission',
-                mission_id: `mission_${Date.now()}`,
+                mission_id: createMissionId(),
                 waypoints: waypoints.map(wp => ({
                     lat: wp.lat,
                     lng: wp.lng,
                 })),
+                path_segments: segments,
                 parameters: {
-                    speed_mps: 1.0,
+                    speed_mps: speedMps,
                     cte_threshold_m: 2.0,
                     mission_timeout_s: 3600,
+                    total_distance_m: totalDistance,
+                    estimated_duration_s: Math.round(totalDistance / speedMps),
                 },
             };
 
@@ -70,8 +92,8 @@ export function setupSocketHandlers(
         socket.on('mission:clear', () => {
             // Full cancel - abort on rover and clear waypoints
             getRoverConnection().sendCommand({ command: 'abort_mission' });
+            // Marks the store dirty; the next broadcast tick delivers it to every client
             vehicleStore.clearWaypoints();
-            socket.emit('state', vehicleStore.getState());
         });
 
         // Handle manual control
@@ -86,11 +108,18 @@ export function setupSocketHandlers(
         });
 
         socket.on('manual:move', (data: { direction: string; speed: number }) => {
-            getRoverConnection().sendCommand({
-                command: 'manual_move',
-                direction: data.direction,
-                speed: data.speed,
-            });
+            const prefix = MANUAL_MOVE_PREFIX.get(data?.direction);
+            const speed = data?.speed;
+
+            // Reject invalid moves here rather than round-tripping an error from the rover
+            if (!prefix || !Number.isInteger(speed) || speed < 0 || speed > 100) {
+                const message = `Invalid manual move (direction: ${data?.direction}, speed: ${speed})`;
+                console.warn(`[Socket] ${message}`);
+                socket.emit('error', { message });
+                return;
+            }
+
+            getRoverConnection().sendRaw(prefix + speed + '}');
         });
 
         // Handle disconnect
@@ -60,12 +60,14 @@ export interface TOFData {
     status: boolean;
 }
 
+// Waypoints are immutable values: edits replace the object, so reference
+// equality is enough for memoization and change detection.
 export interface Waypoint {
-    id: number;
-    lat: number;
-    lng: number;
-    altitude?: number;
-    reached?: boolean;
+    readonly id: number;
+    readonly lat: number;
+    readonly lng: number;
+    readonly altitude?: number;
+    readonly reached?: boolean;
 }
 
 export interface MissionStatus {
@@ -4,7 +4,9 @@
  * Maintains the current state of the rover.
  * Merges partial updates from telemetry into a complete state object.
  * 
- * OPTIMIZED: Uses dirty flag to prevent unnecessary broadcasts.
+ * OPTIMIZED: Uses dirty flag to prevent unnecessary broadcasts, notifies a change
+ * listener so broadcasts are scheduled on demand instead of polled,
+ * and hands out a read-only view instead of copying the state per read.
  */
 
 import { VehicleState, createInitialVehicleState, Waypoint } from './types.js';
@@ -12,7 +14,7 @@ import { VehicleState, createInitialVehicleState, Waypoint } from './types.js';
 export class VehicleStore {
     private state: VehicleState;
     private _isDirty: boolean = false;
-    private _cachedState: VehicleState | null = null;
+    private changeListener: (() => void) | null = null;
 
     constructor() {
         this.state = createInitialVehicleState();
@@ -26,15 +28,18 @@ export class VehicleStore {
     }
 
     /**
-     * Get current complete state (returns cached if not dirty)
+     * Get current complete state as a read-only view (no copy).
+     * Callers must not hold on to it across updates; emit/serialize it immediately.
      */
-    getState(): VehicleState {
-        if (!this._isDirty && this._cachedState) {
-            return this._cachedState;
-        }
-        // Only create new object when state has changed
-        this._cachedState = { ...this.state };
-        return this._cachedState;
+    getState(): Readonly<VehicleState> {
+        return this.state;
+    }
+
+    /**
+     * Register the listener called whenever the state is marked dirty
+     */
+    onChange(listener: () => void): void {
+        this.changeListener = listener;
     }
 
     /**
@@ -46,61 +51,73 @@ export class VehicleStore {
 
     /**
      * Update state with partial data
+     * Nested objects are merged in place to avoid allocating a new object per field group per packet.
+     * Safe because broadcasts serialize the state synchronously.
      */
     update(partial: Partial<VehicleState>): void {
+        const state = this.state;
+
         // Deep merge for nested objects
         if (partial.attitude) {
-            this.state.attitude = { ...this.state.attitude, ...partial.attitude };
+            Object.assign(state.attitude, partial.attitude);
         }
         if (partial.gps) {
-            this.state.gps = { ...this.state.gps, ...partial.gps };
+            Object.assign(state.gps, partial.gps);
         }
         if (partial.imu) {
-            this.state.imu = { ...this.state.imu, ...partial.imu };
+            Object.assign(state.imu, partial.imu);
         }
         if (partial.system) {
-            this.state.system = { ...this.state.system, ...partial.system };
+            Object.assign(state.system, partial.system);
         }
         if (partial.mission) {
-            this.state.mission = { ...this.state.mission, ...partial.mission };
+            Object.assign(state.mission, partial.mission);
         }
         if (partial.waypoints !== undefined) {
-            this.state.waypoints = partial.waypoints;
+            state.waypoints = partial.waypoints;
         }
         if (partial.sensorStatus) {
-            this.state.sensorStatus = { ...this.state.sensorStatus, ...partial.sensorStatus };
+            Object.assign(state.sensorStatus, partial.sensorStatus);
         }
         if (partial.tofData) {
-            this.state.tofData = { ...this.state.tofData, ...partial.tofData };
+            Object.assign(state.tofData, partial.tofData);
         }
 
         // Top-level fields
         if (partial.connected !== undefined) {
-            this.state.connected = partial.connected;
+            state.connected = partial.connected;
         }
         if (partial.lastHeartbeat !== undefined) {
-            this.state.lastHeartbeat = partial.lastHeartbeat;
+            state.lastHeartbeat = partial.lastHeartbeat;
         }
 
         // Mark as dirty after any update
-        this._isDirty = true;
+        this.markDirty();
     }
 
     /**
      * Set connection status
+     * Returns false (and leaves the store clean) if the status did not change.
      */
-    setConnected(connected: boolean): void {
+    setConnected(connected: boolean): boolean {
+        if (this.state.connected === connected) {
+            return false;
+        }
         this.state.connected = connected;
-        this._isDirty = true;
+        this.markDirty();
+        return true;
     }
 
     /**
-     * Set waypoints
+     * Set waypoints (and the planned path length, if known)
+     * Takes ownership of the array without a defensive copy: callers pass a freshly
+     * deserialized list and must not mutate it afterwards.
      */
-    setWaypoints(waypoints: Waypoint[]): void {
+    setWaypoints(waypoints: Waypoint[], totalDistance: number = 0): void {
         this.state.waypoints = waypoints;
         this.state.mission.totalWaypoints = waypoints.length;
-        this._isDirty = true;
+        this.state.mission.totalDistance = totalDistance;
+        this.markDirty();
     }
 
     /**
@@ -109,8 +126,17 @@ export class VehicleStore {
     clearWaypoints(): void {
         this.state.waypoints = [];
         this.state.mission.totalWaypoints = 0;
+        this.state.mission.totalDistance = 0;
         this.state.mission.currentWaypointIndex = 0;
+        this.markDirty();
+    }
+
+    /**
+     * Mark state as changed and notify the listener
+     */
+    private markDirty(): void {
         this._isDirty = true;
+        this.changeListener?.();
     }
 
     /**
@@ -118,7 +144,6 @@ export class VehicleStore {
      */
     reset(): void {
         this.state = createInitialVehicleState();
-        this._cachedState = null;
-        this._isDirty = true;
+        this.markDirty();
     }
 }
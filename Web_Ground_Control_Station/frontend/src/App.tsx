@@ -23,8 +23,10 @@ import {
 } from './components';
 
 function App() {
-    // Only subscribe to controlMode for layout decisions
-    const { controlMode, setControlMode } = useRoverStore();
+    // Only subscribe to controlMode for layout decisions. Selectors are required here:
+    // destructuring the whole store would re-render the entire app on every telemetry update.
+    const controlMode = useRoverStore(state => state.controlMode);
+    const setControlMode = useRoverStore(state => state.setControlMode);
 
     const {
         uploadMission,
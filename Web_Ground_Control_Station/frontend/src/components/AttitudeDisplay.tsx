@@ -8,8 +8,13 @@
 import { useMemo, useRef, useEffect, useState } from 'react';
 import { useRoverStore } from '../store/roverStore';
 
-// Pre-computed pitch ladder marks for performance (±60° with 10° increments)
-const PITCH_MARKS = [-60, -50, -40, -30, -20, -10, 10, 20, 30, 40, 50, 60];
+// Pre-computed pitch ladder marks for performance (±60° with 10° increments).
+// Style objects and labels are built once here and shared by every render.
+const PITCH_MARKS = [-60, -50, -40, -30, -20, -10, 10, 20, 30, 40, 50, 60].map((deg) => ({
+    deg,
+    label: Math.abs(deg),
+    style: { '--deg-offset': `${deg * 0.67}px` } as React.CSSProperties,
+}));
 
 // Pre-computed cardinal directions
 const CARDINALS = [
@@ -19,10 +24,15 @@ const CARDINALS = [
     { label: 'W', angle: 270, color: '#cbd5e1' },
 ] as const;
 
-// Pre-computed tick marks (36 ticks, 10° apart)
+// 16-point compass labels for the heading readout
+const CARDINAL_DIRECTIONS = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+    'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW'];
+
+// Pre-computed tick marks (36 ticks, 10° apart), with their static styles
 const TICK_MARKS = Array.from({ length: 36 }, (_, i) => ({
     angle: i * 10,
-    isMajor: i % 9 === 0,
+    className: i % 9 === 0 ? 'compass-tick-major' : 'compass-tick-minor',
+    style: { '--tick-angle': `${i * 10}deg` } as React.CSSProperties,
 }));
 
 export function AttitudeDisplay() {
@@ -69,7 +79,7 @@ export function AttitudeDisplay() {
 
     return (
         <div className="glass-card p-3">
-            <h3 className="text-sm font-semibold text-slate-400 mb-3 uppercase tracking-wider">
+            <h3 className="card-title mb-3">
                 Attitude
             </h3>
 
@@ -94,14 +104,14 @@ export function AttitudeDisplay() {
 
                         {/* Pitch ladder marks */}
                         <div className="attitude-ladder">
-                            {PITCH_MARKS.map((deg) => (
+                            {PITCH_MARKS.map(({ deg, label, style }) => (
                                 <div
                                     key={deg}
                                     className="attitude-ladder-mark"
-                                    style={{ '--deg-offset': `${deg * 0.67}px` } as React.CSSProperties}
+                                    style={style}
                                 >
                                     <div className="attitude-ladder-line" />
-                                    <span className="attitude-ladder-text">{Math.abs(deg)}</span>
+                                    <span className="attitude-ladder-text">{label}</span>
                                     <div className="attitude-ladder-line" />
                                 </div>
                             ))}
@@ -136,13 +146,13 @@ export function AttitudeDisplay() {
                                 style={{ '--heading': `${smoothHeading}deg` } as React.CSSProperties}
                             >
                                 {/* Tick marks */}
-                                {TICK_MARKS.map(({ angle, isMajor }) => (
+                                {TICK_MARKS.map(({ angle, className, style }) => (
                                     <div
                                         key={angle}
                                         className="compass-tick"
-                                        style={{ '--tick-angle': `${angle}deg` } as React.CSSProperties}
+                                        style={style}
                                     >
-                                        <div className={isMajor ? 'compass-tick-major' : 'compass-tick-minor'} />
+                                        <div className={className} />
                                     </div>
                                 ))}
 
@@ -184,8 +194,6 @@ export function AttitudeDisplay() {
 }
 
 function getCardinalDirection(heading: number): string {
-    const directions = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
-        'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW'];
     const index = Math.round(heading / 22.5) % 16;
-    return directions[index];
+    return CARDINAL_DIRECTIONS[index];
 }
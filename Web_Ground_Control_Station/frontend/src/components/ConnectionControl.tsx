@@ -8,6 +8,12 @@ import { useState } from 'react';
 
 import { useRoverStore } from '../store/roverStore';
 
+// Accept at most five digits; range is checked on the parsed value
+const PORT_INPUT_PATTERN = /^\d{0,5}$/;
+// Loose host format check only (non-empty, no whitespace, DNS length limit). The backend's
+// /rover/connect owns the real IP/hostname rule and its error message is shown on failure.
+const HOST_INPUT_PATTERN = /^\S{1,253}$/;
+
 interface ConnectionControlProps {
     onConnect: (host: string, port: number) => Promise<any>;
     onDisconnect: () => Promise<any>;
@@ -19,17 +25,23 @@ export function ConnectionControl({ onConnect, onDisconnect }: ConnectionControl
     const [port, setPort] = useState('8080');
     const [isConnecting, setIsConnecting] = useState(false);
 
+    // Port is validated as it is typed (digits only), so connecting needs no re-parse
+    const portNum = Number(port);
+    const isPortValid = port.length > 0 && portNum >= 1 && portNum <= 65535;
+    const isHostValid = HOST_INPUT_PATTERN.test(host);
+
+    const handlePortChange = (e: React.ChangeEvent<HTMLInputElement>) => {
+        const value = e.target.value;
+        if (PORT_INPUT_PATTERN.test(value)) {
+            setPort(value);
+        }
+    };
+
     const handleConnect = async () => {
-        if (isConnecting) return;
+        if (isConnecting || !isHostValid || !isPortValid) return;
 
         setIsConnecting(true);
         try {
-            const portNum = parseInt(port, 10);
-            if (isNaN(portNum) || portNum < 1 || portNum > 65535) {
-                alert('Invalid port number');
-                return;
-            }
-
             const result = await onConnect(host, portNum);
             if (!result.success) {
                 alert(result.message || 'Connection failed');
@@ -70,7 +82,8 @@ export function ConnectionControl({ onConnect, onDisconnect }: ConnectionControl
                 <input
                     type="text"
                     value={port}
-                    onChange={(e) => setPort(e.target.value)}
+                    onChange={handlePortChange}
+                    inputMode="numeric"
                     placeholder="8080"
                     disabled={isConnected}
                     className="w-12 bg-transparent text-white text-xs outline-none placeholder-slate-500 disabled:opacity-50"
@@ -88,7 +101,7 @@ export function ConnectionControl({ onConnect, onDisconnect }: ConnectionControl
             ) : (
                 <button
                     onClick={handleConnect}
-                    disabled={isConnecting}
+                    disabled={isConnecting || !isHostValid || !isPortValid}
                     className="px-3 py-1 bg-gcs-success hover:bg-gcs-success/80 text-white text-xs font-medium rounded-lg transition-colors disabled:opacity-50"
                 >
                     {isConnecting ? 'Connecting...' : 'Connect'}
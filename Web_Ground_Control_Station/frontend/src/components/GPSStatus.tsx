@@ -9,13 +9,13 @@ import { useRoverStore } from '../store/roverStore';
 export function GPSStatus() {
     const gps = useRoverStore(state => state.vehicleState.gps);
 
-    // Derived state inside component body is fine as gps object changes ref on update
-    const hasValidPosition = gps.latitude !== 0 || gps.longitude !== 0;
+    // Fix flag is derived once per telemetry frame by the backend; no need to re-test coordinates here
+    const hasValidPosition = gps.fix;
 
     return (
         <div className="glass-card p-3">
             <div className="flex items-center justify-between mb-2">
-                <h3 className="text-sm font-semibold text-slate-400 uppercase tracking-wider">
+                <h3 className="card-title">
                     GPS Status
                 </h3>
                 <div className={`flex items-center gap-1.5 ${hasValidPosition ? 'text-gcs-success' : 'text-gcs-warning'}`}>
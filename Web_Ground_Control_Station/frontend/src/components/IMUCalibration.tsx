@@ -11,7 +11,7 @@ export function IMUCalibration() {
 
     return (
         <div className="glass-card p-3">
-            <h3 className="text-sm font-semibold text-slate-400 mb-3 uppercase tracking-wider">
+            <h3 className="card-title mb-3">
                 IMU Calibration
             </h3>
 
@@ -1,12 +1,14 @@
 import { useRoverStore } from '../store/roverStore';
 
 export function LastHeartbeatDisplay() {
-    const lastHeartbeat = useRoverStore(state => state.vehicleState.lastHeartbeat);
+    // Select whole seconds: the label only shows seconds, so telemetry arriving within
+    // the same second does not re-render or re-format the time string
+    const lastHeartbeatSec = useRoverStore(state => Math.floor(state.vehicleState.lastHeartbeat / 1000));
 
     return (
         <span>
-            Last Update: {lastHeartbeat > 0
-                ? new Date(lastHeartbeat).toLocaleTimeString()
+            Last Update: {lastHeartbeatSec > 0
+                ? new Date(lastHeartbeatSec * 1000).toLocaleTimeString()
                 : 'Never'}
         </span>
     );
@@ -5,7 +5,7 @@
  * Supports multi-button input for curved movement (e.g., Forward + Right).
  */
 
-import { useState, useCallback, useEffect, useRef } from 'react';
+import { useState, useCallback, useEffect, useRef, memo, ChangeEvent, TouchEvent as ReactTouchEvent } from 'react';
 
 interface ManualControlProps {
     onMove: (direction: string, speed: number) => void;
@@ -16,9 +16,26 @@ interface ManualControlProps {
 // Valid base directions
 type BaseDirection = 'forward' | 'backward' | 'left' | 'right';
 
+// Keyboard bindings (static; shared by every mount and effect run)
+const KEY_MAP: Readonly<Record<string, BaseDirection>> = {
+    'ArrowUp': 'forward',
+    'KeyW': 'forward',
+    'ArrowDown': 'backward',
+    'KeyS': 'backward',
+    'ArrowLeft': 'left',
+    'KeyA': 'left',
+    'ArrowRight': 'right',
+    'KeyD': 'right',
+};
+
 export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProps) {
     const [isEnabled, setIsEnabled] = useState(false);
     const [speed, setSpeed] = useState(50);
+    // Latest speed for the send loop. Kept in a ref so dragging the slider does not
+    // re-create sendCurrentMovement and re-run the send effect (which re-sent the
+    // current command, or a stop when idle, on every slider step)
+    const speedRef = useRef(speed);
+    speedRef.current = speed;
     // Track all currently pressed buttons
     const [activeButtons, setActiveButtons] = useState<Set<BaseDirection>>(new Set());
     const sendInterval = useRef<ReturnType<typeof setInterval> | null>(null);
@@ -62,12 +79,17 @@ export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProp
     const sendCurrentMovement = useCallback((buttons: Set<BaseDirection>) => {
         const direction = computeDirection(buttons);
         if (direction) {
-            onMove(direction, speed);
+            onMove(direction, speedRef.current);
         } else if (buttons.size === 0) {
             onMove('stop', 0);
         }
         // If conflicting (null but buttons present), maintain previous state
-    }, [computeDirection, speed, onMove]);
+    }, [computeDirection, onMove]);
+
+    // Slider: read the numeric value directly (no string parse), stable handler
+    const handleSpeedChange = useCallback((e: ChangeEvent<HTMLInputElement>) => {
+        setSpeed(e.target.valueAsNumber);
+    }, []);
 
     // Handle enabling/disabling
     const toggleEnabled = useCallback(() => {
@@ -159,17 +181,6 @@ export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProp
     useEffect(() => {
         if (!isEnabled) return;
 
-        const keyMap: Record<string, BaseDirection> = {
-            'ArrowUp': 'forward',
-            'KeyW': 'forward',
-            'ArrowDown': 'backward',
-            'KeyS': 'backward',
-            'ArrowLeft': 'left',
-            'KeyA': 'left',
-            'ArrowRight': 'right',
-            'KeyD': 'right',
-        };
-
         const handleKeyDown = (e: KeyboardEvent) => {
             // Space to stop
             if (e.code === 'Space') {
@@ -182,7 +193,7 @@ export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProp
             // Without this, pressButton is called repeatedly which can desync state
             if (e.repeat) return;
 
-            const direction = keyMap[e.code];
+            const direction = KEY_MAP[e.code];
             if (direction) {
                 e.preventDefault();
                 console.log('[Keyboard] KeyDown:', direction);
@@ -191,7 +202,7 @@ export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProp
         };
 
         const handleKeyUp = (e: KeyboardEvent) => {
-            const direction = keyMap[e.code];
+            const direction = KEY_MAP[e.code];
             if (direction) {
                 console.log('[Keyboard] KeyUp:', direction);
                 releaseButton(direction);
@@ -231,7 +242,7 @@ export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProp
     return (
         <div className="glass-card p-3">
             <div className="flex items-center justify-between mb-4">
-                <h3 className="text-sm font-semibold text-slate-400 uppercase tracking-wider">
+                <h3 className="card-title">
                     Manual Control
                 </h3>
                 <button
@@ -255,7 +266,7 @@ export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProp
                         max={100}
                         step={10}
                         value={speed}
-                        onChange={(e) => setSpeed(parseInt(e.target.value))}
+                        onChange={handleSpeedChange}
                         className="w-full h-2 bg-gcs-card rounded-lg appearance-none cursor-pointer
                        [&::-webkit-slider-thumb]:appearance-none
                        [&::-webkit-slider-thumb]:w-4
@@ -273,8 +284,8 @@ export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProp
                         direction="forward"
                         label="▲"
                         active={isActive('forward')}
-                        onStart={() => pressButton('forward')}
-                        onStop={() => releaseButton('forward')}
+                        onPress={pressButton}
+                        onRelease={releaseButton}
                     />
 
                     {/* Left, Stop, Right */}
@@ -283,8 +294,8 @@ export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProp
                             direction="left"
                             label="◄"
                             active={isActive('left')}
-                            onStart={() => pressButton('left')}
-                            onStop={() => releaseButton('left')}
+                            onPress={pressButton}
+                            onRelease={releaseButton}
                         />
                         <button
                             onClick={stopAll}
@@ -298,8 +309,8 @@ export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProp
                             direction="right"
                             label="►"
                             active={isActive('right')}
-                            onStart={() => pressButton('right')}
-                            onStop={() => releaseButton('right')}
+                            onPress={pressButton}
+                            onRelease={releaseButton}
                         />
                     </div>
 
@@ -308,8 +319,8 @@ export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProp
                         direction="backward"
                         label="▼"
                         active={isActive('backward')}
-                        onStart={() => pressButton('backward')}
-                        onStop={() => releaseButton('backward')}
+                        onPress={pressButton}
+                        onRelease={releaseButton}
                     />
                 </div>
 
@@ -323,14 +334,21 @@ export function ManualControl({ onMove, onEnable, onDisable }: ManualControlProp
 }
 
 interface DirectionButtonProps {
-    direction: string;
+    direction: BaseDirection;
     label: string;
     active: boolean;
-    onStart: () => void;
-    onStop: () => void;
+    onPress: (direction: BaseDirection) => void;
+    onRelease: (direction: BaseDirection) => void;
 }
 
-function DirectionButton({ label, active, onStart, onStop }: DirectionButtonProps) {
+// Memoized with stable press/release callbacks: only the button whose highlight
+// changed re-renders when another direction is pressed
+const DirectionButton = memo(function DirectionButton({ direction, label, active, onPress, onRelease }: DirectionButtonProps) {
+    const onStart = useCallback(() => onPress(direction), [onPress, direction]);
+    const onStop = useCallback(() => onRelease(direction), [onRelease, direction]);
+    const onTouchStart = useCallback((e: ReactTouchEvent) => { e.preventDefault(); onStart(); }, [onStart]);
+    const onTouchEnd = useCallback((e: ReactTouchEvent) => { e.preventDefault(); onStop(); }, [onStop]);
+
     return (
         <button
             className={`w-16 h-16 rounded-lg border-2 font-bold text-2xl
@@ -342,10 +360,10 @@ function DirectionButton({ label, active, onStart, onStop }: DirectionButtonProp
             onMouseDown={onStart}
             onMouseUp={onStop}
             onMouseLeave={onStop}
-            onTouchStart={(e) => { e.preventDefault(); onStart(); }}
-            onTouchEnd={(e) => { e.preventDefault(); onStop(); }}
+            onTouchStart={onTouchStart}
+            onTouchEnd={onTouchEnd}
         >
             {label}
         </button>
     );
-}
+});
@@ -5,11 +5,11 @@
  * Main MapView is static; child components subscribe individually to store updates.
  */
 
-import { useEffect, useRef, useState, memo } from 'react';
+import { useEffect, useMemo, useRef, useState, memo } from 'react';
 import { MapContainer, TileLayer, Marker, Polyline, useMap, useMapEvents } from 'react-leaflet';
 import L from 'leaflet';
 import 'leaflet/dist/leaflet.css';
-import { useRoverStore, Waypoint } from '../store/roverStore';
+import { useRoverStore, Waypoint, MAX_WAYPOINTS } from '../store/roverStore';
 
 // Fix default marker icons
 delete (L.Icon.Default.prototype as unknown as { _getIconUrl?: unknown })._getIconUrl;
@@ -33,20 +33,33 @@ const ROVER_ICON = new L.DivIcon({
     iconAnchor: [16, 16],
 });
 
-// Memoized Icon creation for waypoints
+// Waypoint icons are built once per (index, active) pair and reused, so re-renders
+// hand Leaflet the same icon object and markers are not rebuilt
+const waypointIconCache = new Map<number, L.DivIcon>();
+
 const getWaypointIcon = (index: number, isActive: boolean) => {
-    return new L.DivIcon({
-        className: 'waypoint-marker-container',
-        html: `
+    const key = index * 2 + (isActive ? 1 : 0);
+    let icon = waypointIconCache.get(key);
+    if (!icon) {
+        icon = new L.DivIcon({
+            className: 'waypoint-marker-container',
+            html: `
       <div class="waypoint-marker ${isActive ? 'waypoint-marker-active' : ''}">
         ${index + 1}
       </div>
     `,
-        iconSize: [24, 24],
-        iconAnchor: [12, 12],
-    });
+            iconSize: [24, 24],
+            iconAnchor: [12, 12],
+        });
+        waypointIconCache.set(key, icon);
+    }
+    return icon;
 };
 
+// Wrap longitude into [-180, 180) in constant time (clicks on wrapped world copies exceed ±180).
+// Floor-based wrap: one division instead of a double modulo to handle negative remainders.
+const normalizeLongitude = (lng: number) => lng - 360 * Math.floor((lng + 180) / 360);
+
 interface MapViewProps {
     onWaypointClick?: (lat: number, lng: number) => void;
     allowWaypointPlacement?: boolean;
@@ -63,7 +76,7 @@ export function MapView({ onWaypointClick, allowWaypointPlacement = true }: MapV
     return (
         <div className="glass-card p-2 h-full min-h-[400px]">
             <div className="flex items-center justify-between mb-2 px-2">
-                <h3 className="text-sm font-semibold text-slate-400 uppercase tracking-wider">
+                <h3 className="card-title">
                     Map View
                 </h3>
                 <div className="flex items-center gap-2">
@@ -164,7 +177,11 @@ const MissionLayer = memo(function MissionLayer() {
     const waypoints = useRoverStore(state => state.waypoints);
     const currentWpIndex = useRoverStore(state => state.vehicleState.mission.currentWaypointIndex);
 
-    const pathPoints: [number, number][] = waypoints.map(wp => [wp.lat, wp.lng]);
+    // Only rebuild the polyline when the waypoint list changes, not when the active index moves
+    const pathPoints = useMemo<[number, number][]>(
+        () => waypoints.map(wp => [wp.lat, wp.lng]),
+        [waypoints]
+    );
 
     return (
         <>
@@ -179,34 +196,45 @@ const MissionLayer = memo(function MissionLayer() {
             )}
 
             {waypoints.map((wp, index) => (
-                <Marker
+                <WaypointMarker
                     key={wp.id}
-                    position={[wp.lat, wp.lng]}
-                    icon={getWaypointIcon(index, index === currentWpIndex)}
+                    waypoint={wp}
+                    index={index}
+                    active={index === currentWpIndex}
                 />
             ))}
         </>
     );
 });
 
-// 5. CLICK HANDLER
-function MapClickHandler({ onWaypointClick }: { onWaypointClick?: (lat: number, lng: number) => void }) {
-    const addWaypoint = useRoverStore(state => state.addWaypoint);
-    const waypointsLength = useRoverStore(state => state.waypoints.length);
+// Waypoints are immutable, so the position tuple is built once per waypoint and the
+// marker only updates when its own waypoint, index or active state changes
+// (otherwise a fresh position array makes react-leaflet call setLatLng every render)
+const WaypointMarker = memo(function WaypointMarker({ waypoint, index, active }: { waypoint: Waypoint; index: number; active: boolean }) {
+    const position = useMemo<[number, number]>(() => [waypoint.lat, waypoint.lng], [waypoint]);
+    return <Marker position={position} icon={getWaypointIcon(index, active)} />;
+});
 
+// 5. CLICK HANDLER - No store subscription; the list length is only needed at click time
+function MapClickHandler({ onWaypointClick }: { onWaypointClick?: (lat: number, lng: number) => void }) {
     useMapEvents({
         click: (e) => {
-            if (waypointsLength < 10) {
-                // Determine ID based on existing max ID or simple length
-                // Ideally this logic should be in the store action, but here is fine for now
-                const newWaypoint: Waypoint = {
-                    id: Date.now(), // Simple unique ID
-                    lat: e.latlng.lat,
-                    lng: e.latlng.lng,
-                };
-                addWaypoint(newWaypoint);
-                onWaypointClick?.(e.latlng.lat, e.latlng.lng);
-            }
+            const { lat, lng: rawLng } = e.latlng;
+            if (!Number.isFinite(lat) || !Number.isFinite(rawLng)) return;
+
+            const { waypoints, addWaypoint } = useRoverStore.getState();
+            if (waypoints.length >= MAX_WAYPOINTS) return;
+
+            const lng = normalizeLongitude(rawLng);
+            // Determine ID based on existing max ID or simple length
+            // Ideally this logic should be in the store action, but here is fine for now
+            const newWaypoint: Waypoint = {
+                id: Date.now(), // Simple unique ID
+                lat,
+                lng,
+            };
+            addWaypoint(newWaypoint);
+            onWaypointClick?.(lat, lng);
         },
     });
     return null;
@@ -10,12 +10,42 @@
  * - PAUSED: Mission stopped (shows Resume/Cancel)
  */
 
-import { useState, useEffect } from 'react';
-import { useRoverStore } from '../store/roverStore';
+import { useState, useEffect, memo } from 'react';
+import { useRoverStore, Waypoint, MAX_WAYPOINTS } from '../store/roverStore';
 
 // Mission UI states
 type MissionUIState = 'IDLE' | 'UPLOADED' | 'ACTIVE' | 'PAUSED';
 
+// Status label and color per UI state (static, built once at module load)
+const STATUS_TEXT: Record<MissionUIState, string> = {
+    IDLE: 'Idle',
+    UPLOADED: 'Ready',
+    ACTIVE: 'Active',
+    PAUSED: 'Paused',
+};
+
+const STATUS_COLOR: Record<MissionUIState, string> = {
+    IDLE: 'text-slate-300',
+    UPLOADED: 'text-gcs-primary',
+    ACTIVE: 'text-gcs-success',
+    PAUSED: 'text-gcs-warning',
+};
+
+// Control groups shown in each UI state, resolved with one lookup per render
+interface ControlVisibility {
+    uploadClear: boolean;
+    start: boolean;
+    stop: boolean;
+    resumeCancel: boolean;
+}
+
+const CONTROL_VISIBILITY: Record<MissionUIState, ControlVisibility> = {
+    IDLE: { uploadClear: true, start: false, stop: false, resumeCancel: false },
+    UPLOADED: { uploadClear: true, start: true, stop: false, resumeCancel: false },
+    ACTIVE: { uploadClear: false, start: false, stop: true, resumeCancel: false },
+    PAUSED: { uploadClear: false, start: false, stop: false, resumeCancel: true },
+};
+
 interface MissionControlProps {
     onUpload: () => void;
     onStart: () => void;
@@ -31,13 +61,17 @@ export function MissionControl({
     onAbort,
     onClear
 }: MissionControlProps) {
-    const { vehicleState, waypoints, clearWaypoints } = useRoverStore();
-    const { mission } = vehicleState;
+    // Narrow selectors: the mission slice keeps its reference until it changes, so the
+    // waypoint list is not re-rendered by attitude/GPS/system telemetry ticks
+    const mission = useRoverStore(state => state.vehicleState.mission);
+    const waypoints = useRoverStore(state => state.waypoints);
+    const clearWaypoints = useRoverStore(state => state.clearWaypoints);
 
     // Local UI state to track mission flow
     const [uiState, setUIState] = useState<MissionUIState>('IDLE');
 
     const hasWaypoints = waypoints.length > 0;
+    const controls = CONTROL_VISIBILITY[uiState];
 
     // Sync UI state with backend mission.active
     useEffect(() => {
@@ -94,28 +128,9 @@ export function MissionControl({
         setUIState('IDLE');
     };
 
-    // Get display status text
-    const getStatusText = () => {
-        switch (uiState) {
-            case 'ACTIVE': return 'Active';
-            case 'PAUSED': return 'Paused';
-            case 'UPLOADED': return 'Ready';
-            default: return 'Idle';
-        }
-    };
-
-    const getStatusColor = () => {
-        switch (uiState) {
-            case 'ACTIVE': return 'text-gcs-success';
-            case 'PAUSED': return 'text-gcs-warning';
-            case 'UPLOADED': return 'text-gcs-primary';
-            default: return 'text-slate-300';
-        }
-    };
-
     return (
         <div className="glass-card p-3">
-            <h3 className="text-sm font-semibold text-slate-400 mb-3 uppercase tracking-wider">
+            <h3 className="card-title mb-3">
                 Mission Control
             </h3>
 
@@ -124,8 +139,8 @@ export function MissionControl({
                 <div className="grid grid-cols-2 gap-3 text-sm">
                     <div>
                         <span className="text-slate-400">Status:</span>
-                        <span className={`ml-2 font-medium ${getStatusColor()}`}>
-                            {getStatusText()}
+                        <span className={`ml-2 font-medium ${STATUS_COLOR[uiState]}`}>
+                            {STATUS_TEXT[uiState]}
                         </span>
                     </div>
                     <div>
@@ -153,7 +168,7 @@ export function MissionControl({
             <div className="mb-4">
                 <div className="flex items-center justify-between mb-2">
                     <span className="text-sm text-slate-400">Waypoints</span>
-                    <span className="text-xs text-slate-500">{waypoints.length}/10</span>
+                    <span className="text-xs text-slate-500">{waypoints.length}/{MAX_WAYPOINTS}</span>
                 </div>
 
                 <div className="max-h-32 overflow-y-auto space-y-1 scrollbar-thin">
@@ -163,25 +178,12 @@ export function MissionControl({
                         </p>
                     ) : (
                         waypoints.map((wp, index) => (
-                            <div
+                            <WaypointRow
                                 key={wp.id}
-                                className={`flex items-center justify-between px-2 py-1 rounded text-sm
-                  ${index === mission.currentWaypointIndex && uiState === 'ACTIVE'
-                                        ? 'bg-gcs-primary/20 border border-gcs-primary'
-                                        : 'bg-gcs-dark'
-                                    }
-                  ${wp.reached ? 'opacity-50' : ''}`}
-                            >
-                                <span className="font-medium text-slate-300">
-                                    WP {index + 1}
-                                </span>
-                                <span className="font-mono text-xs text-slate-400">
-                                    {wp.lat.toFixed(5)}, {wp.lng.toFixed(5)}
-                                </span>
-                                {wp.reached && (
-                                    <span className="text-gcs-success">✓</span>
-                                )}
-                            </div>
+                                waypoint={wp}
+                                index={index}
+                                current={index === mission.currentWaypointIndex && uiState === 'ACTIVE'}
+                            />
                         ))
                     )}
                 </div>
@@ -190,7 +192,7 @@ export function MissionControl({
             {/* Dynamic Control Buttons based on UI State */}
             <div className="space-y-2">
                 {/* State: IDLE or UPLOADED - Show Upload/Clear buttons */}
-                {(uiState === 'IDLE' || uiState === 'UPLOADED') && (
+                {controls.uploadClear && (
                     <div className="grid grid-cols-2 gap-2">
                         <button
                             onClick={handleUpload}
@@ -210,18 +212,17 @@ export function MissionControl({
                 )}
 
                 {/* State: UPLOADED - Show Start button */}
-                {uiState === 'UPLOADED' && hasWaypoints && (
+                {controls.start && hasWaypoints && (
                     <button
                         onClick={handleStart}
-                        className="w-full control-btn bg-gcs-success/20 border-gcs-success text-gcs-success
-                           hover:bg-gcs-success/40"
+                        className="w-full control-btn control-btn-success"
                     >
                         Start Mission
                     </button>
                 )}
 
                 {/* State: ACTIVE - Show only STOP button */}
-                {uiState === 'ACTIVE' && (
+                {controls.stop && (
                     <button
                         onClick={handleStop}
                         className="w-full control-btn control-btn-danger text-lg py-3 font-bold"
@@ -231,12 +232,11 @@ export function MissionControl({
                 )}
 
                 {/* State: PAUSED - Show Resume and Cancel buttons */}
-                {uiState === 'PAUSED' && (
+                {controls.resumeCancel && (
                     <div className="grid grid-cols-2 gap-2">
                         <button
                             onClick={handleResume}
-                            className="control-btn bg-gcs-success/20 border-gcs-success text-gcs-success
-                         hover:bg-gcs-success/40"
+                            className="control-btn control-btn-success"
                         >
                             Resume
                         </button>
@@ -252,3 +252,34 @@ export function MissionControl({
         </div>
     );
 }
+
+interface WaypointRowProps {
+    waypoint: Waypoint;
+    index: number;
+    current: boolean;
+}
+
+// Waypoints are immutable, so a row only re-renders when its own waypoint,
+// position or highlight changes (not when another row is added or progress moves on)
+const WaypointRow = memo(function WaypointRow({ waypoint, index, current }: WaypointRowProps) {
+    return (
+        <div
+            className={`flex items-center justify-between px-2 py-1 rounded text-sm
+                  ${current
+                    ? 'bg-gcs-primary/20 border border-gcs-primary'
+                    : 'bg-gcs-dark'
+                }
+                  ${waypoint.reached ? 'opacity-50' : ''}`}
+        >
+            <span className="font-medium text-slate-300">
+                WP {index + 1}
+            </span>
+            <span className="font-mono text-xs text-slate-400">
+                {waypoint.lat.toFixed(5)}, {waypoint.lng.toFixed(5)}
+            </span>
+            {waypoint.reached && (
+                <span className="text-gcs-success">✓</span>
+            )}
+        </div>
+    );
+});
@@ -4,38 +4,39 @@
  * Displays connection status for individual sensors with icon-based indicators.
  */
 
-import { useRoverStore } from '../store/roverStore';
+import { memo } from 'react';
+import { useRoverStore, SensorStatus } from '../store/roverStore';
+
+// Indicators shown in the bar, in display order
+const SENSORS: readonly { key: keyof SensorStatus; name: string; iconBase: string }[] = [
+    { key: 'accel', name: 'Accel', iconBase: 'sensor_acc' },
+    { key: 'gyro', name: 'Gyro', iconBase: 'sensor_gyro' },
+    { key: 'mag', name: 'Mag', iconBase: 'sensor_mag' },
+    { key: 'gps', name: 'GPS', iconBase: 'sensor_sat' },
+    { key: 'tof', name: 'TOF', iconBase: 'sensor_tof' },
+];
+
+// Warm the browser image cache with both states of every sensor icon at load time,
+// so a sensor flipping on/off swaps to an already-decoded image instead of fetching it
+for (const { iconBase } of SENSORS) {
+    for (const state of ['on', 'off']) {
+        new Image().src = `/icon/${iconBase}_${state}.png`;
+    }
+}
 
 export function SensorStatusBar() {
     const sensorStatus = useRoverStore(state => state.vehicleState.sensorStatus);
 
     return (
         <div className="flex items-center gap-3">
-            <SensorIndicator
-                name="Accel"
-                state={sensorStatus.accel ? 'on' : 'off'}
-                iconBase="sensor_acc"
-            />
-            <SensorIndicator
-                name="Gyro"
-                state={sensorStatus.gyro ? 'on' : 'off'}
-                iconBase="sensor_gyro"
-            />
-            <SensorIndicator
-                name="Mag"
-                state={sensorStatus.mag ? 'on' : 'off'}
-                iconBase="sensor_mag"
-            />
-            <SensorIndicator
-                name="GPS"
-                state={sensorStatus.gps ? 'on' : 'off'}
-                iconBase="sensor_sat"
-            />
-            <SensorIndicator
-                name="TOF"
-                state={sensorStatus.tof ? 'on' : 'off'}
-                iconBase="sensor_tof"
-            />
+            {SENSORS.map(({ key, name, iconBase }) => (
+                <SensorIndicator
+                    key={key}
+                    name={name}
+                    state={sensorStatus[key] ? 'on' : 'off'}
+                    iconBase={iconBase}
+                />
+            ))}
         </div>
     );
 }
@@ -46,7 +47,9 @@ interface SensorIndicatorProps {
     iconBase: string;
 }
 
-function SensorIndicator({ name, state, iconBase }: SensorIndicatorProps) {
+// Props are primitives, so an indicator (and its icon path string) is only rebuilt
+// when that sensor's state flips, not whenever any sensor in the slice changes
+const SensorIndicator = memo(function SensorIndicator({ name, state, iconBase }: SensorIndicatorProps) {
     const iconPath = `/icon/${iconBase}_${state}.png`;
 
     return (
@@ -61,4 +64,4 @@ function SensorIndicator({ name, state, iconBase }: SensorIndicatorProps) {
             </span>
         </div>
     );
-}
+});
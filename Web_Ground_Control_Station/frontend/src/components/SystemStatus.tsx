@@ -4,8 +4,24 @@
  * Displays battery, WiFi, mode, and connection status.
  */
 
+import { memo } from 'react';
 import { useRoverStore } from '../store/roverStore';
 
+// WiFi icon paths, innermost first (static, built once)
+const WIFI_ARC_PATHS = [
+    'M12 18h.01', // Dot
+    'M8.5 14.5a5 5 0 017 0', // Arc 1
+    'M5 11a10 10 0 0114 0', // Arc 2
+    'M1.5 7.5a15 15 0 0121 0', // Arc 3
+];
+
+// Mode badge colors; unknown modes fall back to the neutral style
+const MODE_COLORS: Record<string, string> = {
+    MANUAL: 'bg-gcs-warning text-black',
+    AUTO: 'bg-gcs-success text-black',
+};
+const DEFAULT_MODE_COLOR = 'bg-slate-600 text-white';
+
 export function SystemStatus() {
     const system = useRoverStore(state => state.vehicleState.system);
     const connected = useRoverStore(state => state.vehicleState.connected);
@@ -13,7 +29,7 @@ export function SystemStatus() {
 
     return (
         <div className="glass-card p-3">
-            <h3 className="text-sm font-semibold text-slate-400 mb-3 uppercase tracking-wider">
+            <h3 className="card-title mb-3">
                 System Status
             </h3>
 
@@ -39,7 +55,7 @@ export function SystemStatus() {
                 <div className="flex items-center justify-between">
                     <span className="text-sm text-slate-400">WiFi Signal</span>
                     <div className="flex items-center gap-2">
-                        <WifiIcon strength={system.wifiStrength} />
+                        <WifiIcon bars={getWifiBars(system.wifiStrength)} />
                         <span className="text-sm font-mono text-gcs-primary">
                             {system.wifiStrength} dBm
                         </span>
@@ -49,7 +65,7 @@ export function SystemStatus() {
                 {/* Mode */}
                 <div className="flex items-center justify-between">
                     <span className="text-sm text-slate-400">Mode</span>
-                    <span className={`px-2 py-1 rounded text-xs font-bold ${getModeColor(system.mode)}`}>
+                    <span className={`px-2 py-1 rounded text-xs font-bold ${MODE_COLORS[system.mode] ?? DEFAULT_MODE_COLOR}`}>
                         {system.mode}
                     </span>
                 </div>
@@ -66,20 +82,23 @@ export function SystemStatus() {
     );
 }
 
-function WifiIcon({ strength }: { strength: number }) {
-    // WiFi bars based on dBm
-    let bars = 0;
-    if (strength > -50) bars = 4;
-    else if (strength > -60) bars = 3;
-    else if (strength > -70) bars = 2;
-    else if (strength > -80) bars = 1;
+// WiFi bars based on dBm
+function getWifiBars(strength: number): number {
+    if (strength > -50) return 4;
+    if (strength > -60) return 3;
+    if (strength > -70) return 2;
+    if (strength > -80) return 1;
+    return 0;
+}
 
+// Memoized on the bar count: RSSI jitters every frame, the icon only changes per bar
+const WifiIcon = memo(function WifiIcon({ bars }: { bars: number }) {
     return (
         <svg className="w-4 h-4" viewBox="0 0 24 24" fill="none">
-            {[0, 1, 2, 3].map((i) => (
+            {WIFI_ARC_PATHS.map((d, i) => (
                 <path
                     key={i}
-                    d={getWifiArcPath(i)}
+                    d={d}
                     stroke={i < bars ? '#0ea5e9' : '#334155'}
                     strokeWidth="2"
                     strokeLinecap="round"
@@ -87,26 +106,7 @@ function WifiIcon({ strength }: { strength: number }) {
             ))}
         </svg>
     );
-}
-
-function getWifiArcPath(index: number): string {
-    const paths = [
-        'M12 18h.01', // Dot
-        'M8.5 14.5a5 5 0 017 0', // Arc 1
-        'M5 11a10 10 0 0114 0', // Arc 2
-        'M1.5 7.5a15 15 0 0121 0', // Arc 3
-    ];
-    return paths[index];
-}
-
-
-function getModeColor(mode: string): string {
-    switch (mode) {
-        case 'MANUAL': return 'bg-gcs-warning text-black';
-        case 'AUTO': return 'bg-gcs-success text-black';
-        default: return 'bg-slate-600 text-white';
-    }
-}
+});
 
 function formatUptime(ms: number): string {
     const seconds = Math.floor(ms / 1000);
@@ -14,6 +14,12 @@ import {
     disconnectRover,
 } from '../services/socketService';
 
+// Read waypoints only when a mission is actually sent, instead of subscribing
+// (a subscription would re-render the host component on every waypoint edit)
+function uploadMission() {
+    socketCommands.uploadMission(useRoverStore.getState().waypoints);
+}
+
 export function useSocket() {
     // Initialize socket on mount (idempotent - only runs once)
     useEffect(() => {
@@ -21,12 +27,9 @@ export function useSocket() {
         // No cleanup - socket persists for app lifetime
     }, []);
 
-    // Get stable waypoints reference for upload
-    const waypoints = useRoverStore((state) => state.waypoints);
-
     return {
         // Mission commands
-        uploadMission: () => socketCommands.uploadMission(waypoints),
+        uploadMission,
         startMission: socketCommands.startMission,
         pauseMission: socketCommands.pauseMission,
         resumeMission: socketCommands.resumeMission,
@@ -5,10 +5,11 @@
  * - Avoids closure issues with React hooks
  * - Uses getState() for stable store access
  * - Single connection instance for the entire app
+ * - State messages are coalesced to at most one store update per frame
  */
 
 import { io, Socket } from 'socket.io-client';
-import { useRoverStore } from '../store/roverStore';
+import { useRoverStore, VehicleState } from '../store/roverStore';
 
 const SOCKET_URL = import.meta.env.PROD
     ? window.location.origin
@@ -18,6 +19,40 @@ const SOCKET_URL = import.meta.env.PROD
 let socket: Socket | null = null;
 let isInitialized = false;
 
+// Latest state received but not yet applied to the store (latest wins)
+let pendingState: VehicleState | null = null;
+let flushScheduled = false;
+
+// Fallback delay (about one frame) used while the tab is hidden and rAF is paused
+const HIDDEN_FLUSH_DELAY_MS = 16;
+
+/**
+ * Apply the most recent state once per animation frame.
+ * Bursts of socket messages collapse into a single store update and render.
+ */
+function flushState(): void {
+    flushScheduled = false;
+    if (pendingState) {
+        const state = pendingState;
+        pendingState = null;
+        useRoverStore.getState().setVehicleState(state);
+    }
+}
+
+/**
+ * Schedule a flush on the next frame. Background tabs pause rAF, so fall back to a
+ * timer there to keep the store current.
+ */
+function scheduleFlush(): void {
+    if (flushScheduled) return;
+    flushScheduled = true;
+    if (document.hidden) {
+        setTimeout(flushState, HIDDEN_FLUSH_DELAY_MS);
+    } else {
+        requestAnimationFrame(flushState);
+    }
+}
+
 /**
  * Initialize socket connection (call once on app startup)
  */
@@ -42,13 +77,29 @@ export function initializeSocket(): void {
         useRoverStore.getState().setSocketConnected(false);
     });
 
-    socket.on('state', (state) => {
-        // Direct call to store action via getState()
-        useRoverStore.getState().setVehicleState(state);
+    socket.on('state', (state: VehicleState) => {
+        // Coalesce into the next frame; store action is called via getState()
+        pendingState = state;
+        scheduleFlush();
     });
 
     socket.on('connection:status', (data: { connected: boolean }) => {
         console.log('[Socket] Rover connection status:', data.connected);
+        // Apply the fresh flag now, and patch any queued state so the next flush
+        // cannot overwrite it with an older value
+        if (pendingState) {
+            pendingState = { ...pendingState, connected: data.connected };
+        }
+        const store = useRoverStore.getState();
+        store.setVehicleState({ ...store.vehicleState, connected: data.connected });
+    });
+
+    // A frame scheduled just before the tab was hidden would stall until it is shown
+    // again; flush it right away instead
+    document.addEventListener('visibilitychange', () => {
+        if (document.hidden && flushScheduled) {
+            flushState();
+        }
     });
 
     isInitialized = true;
@@ -74,7 +125,7 @@ export function disconnectSocket(): void {
 
 // Socket command helpers
 export const socketCommands = {
-    uploadMission: (waypoints: unknown[]) => {
+    uploadMission: (waypoints: readonly unknown[]) => {
         socket?.emit('mission:upload', waypoints);
     },
     startMission: () => {
@@ -65,12 +65,14 @@ export interface TOFData {
     status: boolean;
 }
 
+// Waypoints are immutable values: edits replace the object, so reference
+// equality is enough for memoization and change detection.
 export interface Waypoint {
-    id: number;
-    lat: number;
-    lng: number;
-    altitude?: number;
-    reached?: boolean;
+    readonly id: number;
+    readonly lat: number;
+    readonly lng: number;
+    readonly altitude?: number;
+    readonly reached?: boolean;
 }
 
 export interface MissionStatus {
@@ -97,9 +99,13 @@ export interface VehicleState {
 
 export type ControlMode = 'mission' | 'manual';
 
+// Mission capacity; must match MAX_WAYPOINTS in the rover firmware config
+export const MAX_WAYPOINTS = 10;
+
 interface RoverStore {
     vehicleState: VehicleState;
-    waypoints: Waypoint[];
+    // Read-only: components read the store's array directly (no copies); actions replace it
+    waypoints: readonly Waypoint[];
     controlMode: ControlMode;
     isSocketConnected: boolean;
 
@@ -111,7 +117,7 @@ interface RoverStore {
     setSocketConnected: (connected: boolean) => void;
     addWaypoint: (waypoint: Waypoint) => void;
     clearWaypoints: () => void;
-    setWaypoints: (waypoints: Waypoint[]) => void;
+    setWaypoints: (waypoints: readonly Waypoint[]) => void;
 }
 
 const initialVehicleState: VehicleState = {
@@ -187,48 +193,61 @@ export const useRoverStore = create<RoverStore>()(
         setVehicleState: (newState) => {
             const current = get().vehicleState;
 
-            // Filter out waypoints from backend
-            const { waypoints: _, ...stateWithoutWaypoints } = newState;
-
-            // OPTIMIZATION: Only update slices that actually changed
+            // OPTIMIZATION: Only update slices that actually changed.
+            // Slices are picked individually, so backend waypoints are never copied in,
+            // and a flag tracks changes instead of counting keys afterwards.
             const updates: Partial<VehicleState> = {};
+            let changed = false;
 
-            if (!shallowEqual(current.attitude, stateWithoutWaypoints.attitude)) {
-                updates.attitude = stateWithoutWaypoints.attitude;
+            if (!shallowEqual(current.attitude, newState.attitude)) {
+                updates.attitude = newState.attitude;
+                changed = true;
             }
-            if (!shallowEqual(current.gps, stateWithoutWaypoints.gps)) {
-                updates.gps = stateWithoutWaypoints.gps;
+            if (!shallowEqual(current.gps, newState.gps)) {
+                updates.gps = newState.gps;
+                changed = true;
             }
-            if (!shallowEqual(current.system, stateWithoutWaypoints.system)) {
-                updates.system = stateWithoutWaypoints.system;
+            if (!shallowEqual(current.system, newState.system)) {
+                updates.system = newState.system;
+                changed = true;
             }
-            if (!shallowEqual(current.sensorStatus, stateWithoutWaypoints.sensorStatus)) {
-                updates.sensorStatus = stateWithoutWaypoints.sensorStatus;
+            if (!shallowEqual(current.sensorStatus, newState.sensorStatus)) {
+                updates.sensorStatus = newState.sensorStatus;
+                changed = true;
             }
-            if (!shallowEqual(current.mission, stateWithoutWaypoints.mission)) {
-                updates.mission = stateWithoutWaypoints.mission;
+            if (!shallowEqual(current.mission, newState.mission)) {
+                updates.mission = newState.mission;
+                changed = true;
             }
-            if (!shallowEqual(current.tofData, stateWithoutWaypoints.tofData)) {
-                updates.tofData = stateWithoutWaypoints.tofData;
+            if (!shallowEqual(current.tofData, newState.tofData)) {
+                updates.tofData = newState.tofData;
+                changed = true;
             }
-            if (current.connected !== stateWithoutWaypoints.connected) {
-                updates.connected = stateWithoutWaypoints.connected;
+            if (current.connected !== newState.connected) {
+                updates.connected = newState.connected;
+                changed = true;
             }
-            if (current.lastHeartbeat !== stateWithoutWaypoints.lastHeartbeat) {
-                updates.lastHeartbeat = stateWithoutWaypoints.lastHeartbeat;
+            if (current.lastHeartbeat !== newState.lastHeartbeat) {
+                updates.lastHeartbeat = newState.lastHeartbeat;
+                changed = true;
             }
 
-            // IMU has nested calibration object - check separately
-            if (stateWithoutWaypoints.imu) {
-                const imuChanged = !shallowEqual(current.imu, stateWithoutWaypoints.imu) ||
-                    !shallowEqual(current.imu.calibration, stateWithoutWaypoints.imu.calibration);
-                if (imuChanged) {
-                    updates.imu = stateWithoutWaypoints.imu;
+            // IMU has nested calibration object - check separately.
+            // Calibration changes rarely while IMU vectors change every frame, so keep the
+            // previous calibration reference when its levels are equal; subscribers to
+            // imu.calibration then skip re-rendering identical values.
+            if (newState.imu) {
+                const calibrationChanged = !shallowEqual(current.imu.calibration, newState.imu.calibration);
+                if (calibrationChanged || !shallowEqual(current.imu, newState.imu)) {
+                    updates.imu = calibrationChanged
+                        ? newState.imu
+                        : { ...newState.imu, calibration: current.imu.calibration };
+                    changed = true;
                 }
             }
 
             // Only set if something actually changed
-            if (Object.keys(updates).length > 0) {
+            if (changed) {
                 set({
                     vehicleState: {
                         ...current,
@@ -242,12 +261,17 @@ export const useRoverStore = create<RoverStore>()(
 
         setSocketConnected: (connected) => set({ isSocketConnected: connected }),
 
-        addWaypoint: (waypoint) => set((state) => ({
-            waypoints: [...state.waypoints, waypoint],
-        })),
+        // Capacity checked before building the new array; a full list returns the
+        // same state object, so zustand skips notifying subscribers
+        addWaypoint: (waypoint) => set((state) => (
+            state.waypoints.length >= MAX_WAYPOINTS
+                ? state
+                : { waypoints: [...state.waypoints, waypoint] }
+        )),
 
         clearWaypoints: () => set({ waypoints: [] }),
 
+        // Takes ownership of the array (no copy); callers must pass a new array, not mutate the old one
         setWaypoints: (waypoints) => set({ waypoints }),
     }))
 );
@@ -17,4 +17,17 @@ export default defineConfig({
             },
         },
     },
+    build: {
+        rollupOptions: {
+            output: {
+                // Heavy third-party libraries in their own chunks: fetched in parallel
+                // with the app code and kept cached across app-only rebuilds
+                manualChunks: {
+                    react: ['react', 'react-dom'],
+                    map: ['leaflet', 'react-leaflet'],
+                    socket: ['socket.io-client'],
+                },
+            },
+        },
+    },
 })
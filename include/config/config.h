@@ -125,9 +125,11 @@
 // ============================================================================
 
 #define DEBUG_SERIAL_BAUD        115200
+#define ROVER_SERIAL_TX_BUF      1024   // UART TX ring buffer (driver drains it in the background)
 #define ENABLE_DEBUG_LOGGING     true
 #define ENABLE_SENSOR_DEBUG      true
 #define ENABLE_NAVIGATION_DEBUG  true
+#define ENABLE_COMMAND_DEBUG     false  // Echo every received command / sent response (20 Hz in manual mode)
 
 // ============================================================================
 // ERROR HANDLING
@@ -194,6 +194,7 @@ private:
     GPSPosition currentPosition;
     IMUData currentIMUData;
     Waypoint waypoints[MAX_WAYPOINTS];
+    int waypointCount;  // Number of valid waypoints (avoids rescanning the array)
     RoverState roverState;
     SystemStatus systemStatus;
     
@@ -291,4 +292,8 @@ double calculateDistance(double lat1, double lon1, double lat2, double lon2);
 // Bearing calculation utility
 double calculateBearing(double lat1, double lon1, double lat2, double lon2);
 
+// Distance and bearing in one pass (shares the radian conversions and cosines)
+void calculateDistanceAndBearing(double lat1, double lon1, double lat2, double lon2,
+                                 double& distance, double& bearing);
+
 #endif // SHARED_DATA_H
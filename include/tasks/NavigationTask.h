@@ -46,7 +46,7 @@ private:
     // Private methods
     void processNavigation();
     void updateSharedState();
-    void calculatePID();
+    void calculatePID(float currentHeading);
     void calculateCrossTrackError();
     void updateMotorSpeeds();
     void stopMotors();
@@ -27,6 +27,7 @@ private:
     void processSpeedCommand(int speed);
     
     // Mission planning/execution commands (new protocol)
+    bool loadMissionFromJson();   // Parse mission payload into shared data (PLANNED state)
     void processUploadMission();  // Upload waypoints only (no auto-start)
     void processStartMission();   // Legacy: upload + auto-start
     void processPauseMission();
@@ -40,6 +41,7 @@ private:
     
     // Response sending
     void sendResponse(const String& response);
+    void sendResponse(const char* response);
     void sendError(const String& error);
     void sendStatus();
 
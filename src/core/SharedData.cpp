@@ -21,7 +21,8 @@ SharedData::SharedData() {
     missionMutex = NULL;
     manualControlMutex = NULL;
     
-    // Initialize mission data
+    // Initialize waypoint and mission data
+    waypointCount = 0;
     segmentCount = 0;
     missionId[0] = '\0';  // Empty string
     
@@ -128,6 +129,8 @@ bool SharedData::setWaypoint(int index, const Waypoint& waypoint) {
     if (index < 0 || index >= MAX_WAYPOINTS) return false;
     
     if (xSemaphoreTake(waypointsMutex, pdMS_TO_TICKS(100)) == pdTRUE) {
+        // Keep the valid-waypoint counter in sync with the slot being replaced
+        waypointCount += (int)waypoint.isValid - (int)waypoints[index].isValid;
         waypoints[index] = waypoint;
         xSemaphoreGive(waypointsMutex);
         return true;
@@ -140,6 +143,7 @@ bool SharedData::clearWaypoints() {
         for (int i = 0; i < MAX_WAYPOINTS; i++) {
             waypoints[i] = Waypoint();
         }
+        waypointCount = 0;
         xSemaphoreGive(waypointsMutex);
         return true;
     }
@@ -149,23 +153,25 @@ bool SharedData::clearWaypoints() {
 int SharedData::getWaypointCount() {
     int count = 0;
     if (xSemaphoreTake(waypointsMutex, pdMS_TO_TICKS(100)) == pdTRUE) {
-        for (int i = 0; i < MAX_WAYPOINTS; i++) {
-            if (waypoints[i].isValid) count++;
-        }
+        count = waypointCount;  // O(1): maintained by add/set/clear
         xSemaphoreGive(waypointsMutex);
     }
     return count;
 }
 
 bool SharedData::addWaypoint(const Waypoint& waypoint) {
+    if (!waypoint.isValid) return false;
+    
     if (xSemaphoreTake(waypointsMutex, pdMS_TO_TICKS(100)) == pdTRUE) {
-        int count = getWaypointCount();
-        if (count < MAX_WAYPOINTS) {
-            waypoints[count] = waypoint;
-            xSemaphoreGive(waypointsMutex);
-            return true;
+        // Use the counter directly: calling getWaypointCount() here would
+        // re-take the (non-recursive) mutex we already hold and time out
+        bool added = false;
+        if (waypointCount < MAX_WAYPOINTS) {
+            waypoints[waypointCount++] = waypoint;
+            added = true;
         }
         xSemaphoreGive(waypointsMutex);
+        return added;
     }
     return false;
 }
@@ -286,14 +292,15 @@ double normalizeAngle(double angle) {
 double calculateDistance(double lat1, double lon1, double lat2, double lon2) {
     const double R = EARTH_RADIUS; // Earth's radius in meters
     
-    double lat1Rad = lat1 * M_PI / 180.0;
-    double lat2Rad = lat2 * M_PI / 180.0;
-    double deltaLat = (lat2 - lat1) * M_PI / 180.0;
-    double deltaLon = (lon2 - lon1) * M_PI / 180.0;
+    double lat1Rad = lat1 * DEG_TO_RAD;
+    double lat2Rad = lat2 * DEG_TO_RAD;
+    // Half-angle sines computed once and squared, not evaluated twice each
+    double sinHalfDLat = sin((lat2Rad - lat1Rad) * 0.5);
+    double sinHalfDLon = sin((lon2 - lon1) * DEG_TO_RAD * 0.5);
     
-    double a = sin(deltaLat / 2) * sin(deltaLat / 2) +
+    double a = sinHalfDLat * sinHalfDLat +
                cos(lat1Rad) * cos(lat2Rad) *
-               sin(deltaLon / 2) * sin(deltaLon / 2);
+               sinHalfDLon * sinHalfDLon;
     double c = 2 * atan2(sqrt(a), sqrt(1 - a));
     
     return R * c;
@@ -312,6 +319,26 @@ double calculateBearing(double lat1, double lon1, double lat2, double lon2) {
     return normalizeAngle(bearing);
 }
 
+void calculateDistanceAndBearing(double lat1, double lon1, double lat2, double lon2,
+                                 double& distance, double& bearing) {
+    double lat1Rad = lat1 * DEG_TO_RAD;
+    double lat2Rad = lat2 * DEG_TO_RAD;
+    double deltaLon = (lon2 - lon1) * DEG_TO_RAD;
+    double cosLat1 = cos(lat1Rad);
+    double cosLat2 = cos(lat2Rad);
+    
+    // Haversine distance
+    double sinHalfDLat = sin((lat2Rad - lat1Rad) * 0.5);
+    double sinHalfDLon = sin(deltaLon * 0.5);
+    double a = sinHalfDLat * sinHalfDLat + cosLat1 * cosLat2 * sinHalfDLon * sinHalfDLon;
+    distance = EARTH_RADIUS * 2 * atan2(sqrt(a), sqrt(1 - a));
+    
+    // Initial bearing, reusing the cosines above
+    double y = sin(deltaLon) * cosLat2;
+    double x = cosLat1 * sin(lat2Rad) - sin(lat1Rad) * cosLat2 * cos(deltaLon);
+    bearing = normalizeAngle(atan2(y, x) * RAD_TO_DEG);
+}
+
 // ============================================================================
 // MISSION DATA METHODS IMPLEMENTATION
 // ============================================================================
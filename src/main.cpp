@@ -78,6 +78,14 @@ void systemWatchdog();
 // ============================================================================
 
 void setup() {
+    // Larger TX ring buffer so log bursts are queued and drained by the UART driver
+    // instead of blocking the printing task at 115200 baud (must precede begin()).
+    // setTxBufferSize() only exists in arduino-esp32 >= 2.0.3; older cores keep the default.
+#if defined(ESP_ARDUINO_VERSION_VAL)
+#if ESP_ARDUINO_VERSION >= ESP_ARDUINO_VERSION_VAL(2, 0, 3)
+    Serial.setTxBufferSize(ROVER_SERIAL_TX_BUF);
+#endif
+#endif
     Serial.begin(115200);
     Serial.println("ESP32 Autonomous Rover starting up...");
     
@@ -69,12 +69,15 @@ void NavigationTask::run() {
         
         // 2. Navigation Logic High-Level (Waypoint logic, Heading calculation)
         // Runs less frequently (e.g. 100ms matches GPS/IMU update)
-        if (isNavigating && !sharedData.isManualModeActive()) {
-            processNavigation();
-        } else if (sharedData.isManualModeActive() && isNavigating) {
-            // If manual mode activated while navigating, pause.
-             Serial.println("[Navigation] Manual mode active - pausing navigation");
-             stopNavigation();
+        // Manual mode flag is read once per loop (one mutex round-trip), and only while navigating
+        if (isNavigating) {
+            if (!sharedData.isManualModeActive()) {
+                processNavigation();
+            } else {
+                // If manual mode activated while navigating, pause.
+                Serial.println("[Navigation] Manual mode active - pausing navigation");
+                stopNavigation();
+            }
         }
 
         // 3. Navigation Status Update (Telemetry)
@@ -145,34 +148,23 @@ void NavigationTask::processNavigation() {
     targetLatitude = currentWaypoint.latitude;
     targetLongitude = currentWaypoint.longitude;
     
-    // Calculate target bearing
-    targetBearing = calculateBearing(
-        currentPosition.latitude, currentPosition.longitude,
-        targetLatitude, targetLongitude
-    );
-    
-    // Calculate distance to current waypoint
-    distanceToTarget = calculateDistance(
+    // Calculate distance and bearing to current waypoint in one pass
+    calculateDistanceAndBearing(
         currentPosition.latitude, currentPosition.longitude,
-        targetLatitude, targetLongitude
+        targetLatitude, targetLongitude,
+        distanceToTarget, targetBearing
     );
     
-    // Calculate bearing from current position to target
-    double bearing = calculateBearing(
-        currentPosition.latitude, currentPosition.longitude,
-        targetLatitude, targetLongitude
-    );
-    
-    // Get current heading
-    sharedData.getIMUData(currentIMUData);
+    // Current heading from the IMU snapshot taken above (no second copy under the mutex)
     double currentHeading = currentIMUData.heading;
     
     // Calculate cross-track error (perpendicular distance from path)
-    double headingDiff = normalizeAngle(bearing - currentHeading);
+    // Reuses targetBearing: same position/target pair, no need to redo the trig
+    double headingDiff = normalizeAngle(targetBearing - currentHeading);
     crossTrackError = distanceToTarget * sin(radians(headingDiff));
     
     // Calculate PID control
-    calculatePID();
+    calculatePID(currentHeading);
     
     // Update motor speeds
     updateMotorSpeeds();
@@ -227,15 +219,12 @@ void NavigationTask::updateSharedState() {
 // PID CONTROL
 // ============================================================================
 
-void NavigationTask::calculatePID() {
+void NavigationTask::calculatePID(float currentHeading) {
     unsigned long now = millis();
     float dt = (now - lastUpdateTime) / 1000.0f; // Convert to seconds
     if (dt <= 0.0) dt = 0.1f; // Safety fallback
 
     // Calculate heading error (difference between target and current heading)
-    IMUData currentIMUData;
-    sharedData.getIMUData(currentIMUData);
-    float currentHeading = currentIMUData.heading;
     float headingError = normalizeAngle(targetBearing - currentHeading);
     
     // Apply cross-track error correction
@@ -105,6 +105,14 @@ void TelemetryTask::processTelemetry() {
 // TELEMETRY DATA BUILDING
 // ============================================================================
 
+// Serialize a contiguous float vector as a JSON array
+static void addVector(JsonObject parent, const char* key, const float* values, size_t count) {
+    JsonArray arr = parent[key].to<JsonArray>();
+    for (size_t i = 0; i < count; i++) {
+        arr.add(values[i]);
+    }
+}
+
 void TelemetryTask::buildTelemetryData() {
     // Clear previous data
     telemetryDoc.clear();
@@ -134,92 +142,39 @@ void TelemetryTask::buildTelemetryData() {
         telemetryDoc["hdop"] = 99.0;
     }
     
-    if (hasIMU) {
-        telemetryDoc["heading"] = currentIMUData.heading;
-        telemetryDoc["temperature"] = currentIMUData.temperature;
-        
-        // Create BNO055 enhanced IMU data structure
-        JsonObject imu_data = telemetryDoc["imu_data"].to<JsonObject>();
-        
-        // Enhanced BNO055 data 
-        imu_data["roll"] = currentIMUData.roll;
-        imu_data["pitch"] = currentIMUData.pitch;
-        
-        // Quaternion
-        JsonArray quat = imu_data["quaternion"].to<JsonArray>();
-        quat.add(currentIMUData.quaternion[0]);
-        quat.add(currentIMUData.quaternion[1]);
-        quat.add(currentIMUData.quaternion[2]);
-        quat.add(currentIMUData.quaternion[3]);
-        
-        // Raw sensor data
-        JsonArray accel = imu_data["accel"].to<JsonArray>();
-        accel.add(currentIMUData.acceleration[0]);
-        accel.add(currentIMUData.acceleration[1]);
-        accel.add(currentIMUData.acceleration[2]);
-        
-        JsonArray gyro = imu_data["gyro"].to<JsonArray>();
-        gyro.add(currentIMUData.gyroscope[0]);
-        gyro.add(currentIMUData.gyroscope[1]);
-        gyro.add(currentIMUData.gyroscope[2]);
-        
-        JsonArray mag = imu_data["mag"].to<JsonArray>();
-        mag.add(currentIMUData.magnetometer[0]);
-        mag.add(currentIMUData.magnetometer[1]);
-        mag.add(currentIMUData.magnetometer[2]);
-        
-        // Enhanced BNO055 data
-        JsonArray linear_accel = imu_data["linear_accel"].to<JsonArray>();
-        linear_accel.add(currentIMUData.linearAccel[0]);
-        linear_accel.add(currentIMUData.linearAccel[1]);
-        linear_accel.add(currentIMUData.linearAccel[2]);
-        
-        JsonArray gravity = imu_data["gravity"].to<JsonArray>();
-        gravity.add(currentIMUData.gravity[0]);
-        gravity.add(currentIMUData.gravity[1]);
-        gravity.add(currentIMUData.gravity[2]);
-        
-        // BNO055 calibration status
-        JsonObject cal = imu_data["calibration"].to<JsonObject>();
-        cal["sys"] = currentIMUData.calibrationStatus.system;
-        cal["gyro"] = currentIMUData.calibrationStatus.gyroscope;
-        cal["accel"] = currentIMUData.calibrationStatus.accelerometer;
-        cal["mag"] = currentIMUData.calibrationStatus.magnetometer;
-        
-        // Temperature in IMU data for BNO055
-        imu_data["temperature"] = currentIMUData.temperature;
-    } else {
-        telemetryDoc["heading"] = 0.0;
-        telemetryDoc["temperature"] = 0.0;
-        
-        // Create empty IMU structure
-        JsonObject imu_data = telemetryDoc["imu_data"].to<JsonObject>();
-        imu_data["roll"] = 0.0;
-        imu_data["pitch"] = 0.0;
-        
-        JsonArray quat = imu_data["quaternion"].to<JsonArray>();
-        quat.add(1.0); quat.add(0.0); quat.add(0.0); quat.add(0.0);
-        
-        JsonArray accel = imu_data["accel"].to<JsonArray>();
-        accel.add(0.0); accel.add(0.0); accel.add(0.0);
-        
-        JsonArray gyro = imu_data["gyro"].to<JsonArray>();
-        gyro.add(0.0); gyro.add(0.0); gyro.add(0.0);
-        
-        JsonArray mag = imu_data["mag"].to<JsonArray>();
-        mag.add(0.0); mag.add(0.0); mag.add(0.0);
-        
-        JsonArray linear_accel = imu_data["linear_accel"].to<JsonArray>();
-        linear_accel.add(0.0); linear_accel.add(0.0); linear_accel.add(0.0);
-        
-        JsonArray gravity = imu_data["gravity"].to<JsonArray>();
-        gravity.add(0.0); gravity.add(0.0); gravity.add(0.0);
-        
-        JsonObject cal = imu_data["calibration"].to<JsonObject>();
-        cal["sys"] = 0; cal["gyro"] = 0; cal["accel"] = 0; cal["mag"] = 0;
-        
-        imu_data["temperature"] = 0.0;
-    }
+    // A default-constructed IMUData already holds the "no IMU" values
+    // (zeros, identity quaternion), so one serialization path covers both cases
+    telemetryDoc["heading"] = currentIMUData.heading;
+    telemetryDoc["temperature"] = currentIMUData.temperature;
+    
+    // Create BNO055 enhanced IMU data structure
+    JsonObject imu_data = telemetryDoc["imu_data"].to<JsonObject>();
+    
+    // Enhanced BNO055 data 
+    imu_data["roll"] = currentIMUData.roll;
+    imu_data["pitch"] = currentIMUData.pitch;
+    
+    // Quaternion
+    addVector(imu_data, "quaternion", currentIMUData.quaternion, 4);
+    
+    // Raw sensor data
+    addVector(imu_data, "accel", currentIMUData.acceleration, 3);
+    addVector(imu_data, "gyro", currentIMUData.gyroscope, 3);
+    addVector(imu_data, "mag", currentIMUData.magnetometer, 3);
+    
+    // Enhanced BNO055 data
+    addVector(imu_data, "linear_accel", currentIMUData.linearAccel, 3);
+    addVector(imu_data, "gravity", currentIMUData.gravity, 3);
+    
+    // BNO055 calibration status
+    JsonObject cal = imu_data["calibration"].to<JsonObject>();
+    cal["sys"] = currentIMUData.calibrationStatus.system;
+    cal["gyro"] = currentIMUData.calibrationStatus.gyroscope;
+    cal["accel"] = currentIMUData.calibrationStatus.accelerometer;
+    cal["mag"] = currentIMUData.calibrationStatus.magnetometer;
+    
+    // Temperature in IMU data for BNO055
+    imu_data["temperature"] = currentIMUData.temperature;
     
     // Add WiFi signal strength
     telemetryDoc["wifi_strength"] = WiFi.RSSI();
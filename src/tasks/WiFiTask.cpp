@@ -73,7 +73,9 @@ void WiFiTask::run() {
             data.trim();
             
             if (data.length() > 0) {
-                Serial.printf("Received: %s\n", data.c_str());
+                if (ENABLE_COMMAND_DEBUG) {
+                    Serial.printf("Received: %s\n", data.c_str());
+                }
                 processCommand(data);
             }
         }
@@ -89,6 +91,60 @@ void WiFiTask::run() {
 // COMMAND PROCESSING
 // ============================================================================
 
+// Command name -> type table. Resolving the name once with strcmp on the
+// parsed const char* avoids a heap String plus a chain of String compares.
+// manual_move comes first: it arrives at 20 Hz while driving.
+enum class CommandType {
+    ManualMove, EnableManual, DisableManual,
+    UploadMission, StartMission, PauseMission, AbortMission, ResumeMission,
+    Start, Stop, SetSpeed, GetStatus,
+    Unknown
+};
+
+struct CommandEntry {
+    const char* name;
+    CommandType type;
+};
+
+static const CommandEntry COMMAND_TABLE[] = {
+    {"manual_move",    CommandType::ManualMove},
+    {"enable_manual",  CommandType::EnableManual},
+    {"disable_manual", CommandType::DisableManual},
+    {"upload_mission", CommandType::UploadMission},
+    {"start_mission",  CommandType::StartMission},
+    {"pause_mission",  CommandType::PauseMission},
+    {"abort_mission",  CommandType::AbortMission},
+    {"resume_mission", CommandType::ResumeMission},
+    {"start",          CommandType::Start},
+    {"stop",           CommandType::Stop},
+    {"set_speed",      CommandType::SetSpeed},
+    {"get_status",     CommandType::GetStatus},
+};
+
+static CommandType lookupCommand(const char* name) {
+    for (const CommandEntry& entry : COMMAND_TABLE) {
+        if (strcmp(name, entry.name) == 0) {
+            return entry.type;
+        }
+    }
+    return CommandType::Unknown;
+}
+
+// Directions accepted by manual_move (single and combined)
+static const char* const MANUAL_DIRECTIONS[] = {
+    "forward", "backward", "left", "right", "stop",
+    "forward_left", "forward_right", "backward_left", "backward_right",
+};
+
+static bool isValidManualDirection(const char* direction) {
+    for (const char* valid : MANUAL_DIRECTIONS) {
+        if (strcmp(direction, valid) == 0) {
+            return true;
+        }
+    }
+    return false;
+}
+
 void WiFiTask::processCommand(const String& command) {
     jsonDoc.clear();
     
@@ -100,42 +156,39 @@ void WiFiTask::processCommand(const String& command) {
     
     // New mission-first protocol
     if (jsonDoc["command"].is<const char*>()) {
-        String cmd = jsonDoc["command"].as<const char*>(); // e.g., upload_mission, start_mission, pause_mission, abort_mission, resume_mission
-
-        // Upload mission - load waypoints but don't start navigation
-        if (cmd == "upload_mission") {
-            processUploadMission();
-            return;
-        }
-        // Start mission - legacy command that uploads AND starts (for backward compatibility)
-        if (cmd == "start_mission") {
-            processStartMission();
-            return;
-        }
-        if (cmd == "pause_mission") { processPauseMission(); return; }
-        if (cmd == "abort_mission") { processAbortMission(); return; }
-        if (cmd == "resume_mission") { processResumeMission(); return; }
-
-        // Backward-compatible legacy controls
-        if (cmd == "start") { processStartCommand(); return; }
-        if (cmd == "stop") { processStopCommand(); return; }
-        if (cmd == "set_speed") {
-            if (jsonDoc["speed"].is<int>()) {
-                int speed = jsonDoc["speed"].as<int>();
-                processSpeedCommand(speed);
+        const char* cmd = jsonDoc["command"].as<const char*>(); // e.g., upload_mission, start_mission, pause_mission, abort_mission, resume_mission
+
+        switch (lookupCommand(cmd)) {
+            // Manual control commands
+            case CommandType::ManualMove:    processManualMove(); return;
+            case CommandType::EnableManual:  processEnableManual(); return;
+            case CommandType::DisableManual: processDisableManual(); return;
+
+            // Upload mission - load waypoints but don't start navigation
+            case CommandType::UploadMission: processUploadMission(); return;
+            // Start mission - legacy command that uploads AND starts (for backward compatibility)
+            case CommandType::StartMission:  processStartMission(); return;
+            case CommandType::PauseMission:  processPauseMission(); return;
+            case CommandType::AbortMission:  processAbortMission(); return;
+            case CommandType::ResumeMission: processResumeMission(); return;
+
+            // Backward-compatible legacy controls
+            case CommandType::Start:         processStartCommand(); return;
+            case CommandType::Stop:          processStopCommand(); return;
+            case CommandType::SetSpeed:
+                if (jsonDoc["speed"].is<int>()) {
+                    processSpeedCommand(jsonDoc["speed"].as<int>());
+                    return;
+                }
+                sendError("Speed value required");
                 return;
-            }
-            sendError("Speed value required");
-            return;
-        }
-        if (cmd == "get_status") { sendStatus(); return; }
+            case CommandType::GetStatus:     sendStatus(); return;
 
-        // Manual control commands
-        if (cmd == "enable_manual") { processEnableManual(); return; }
-        if (cmd == "disable_manual") { processDisableManual(); return; }
-        if (cmd == "manual_move") { processManualMove(); return; }
+            case CommandType::Unknown:
+                break;
+        }
 
-        sendError("Unknown command: " + cmd);
+        sendError("Unknown command: " + String(cmd));
         return;
     }
 
@@ -170,10 +223,8 @@ void WiFiTask::processWaypoints(const JsonArray& waypoints) {
             double lat = waypoint["lat"].as<double>();
             double lng = hasLatLng ? waypoint["lng"].as<double>() : waypoint["lon"].as<double>();
             
-            Waypoint wp;
-            wp.latitude = lat;
-            wp.longitude = lng;
             // Waypoint structure doesn't have an id field
+            Waypoint wp(lat, lng);
             
             if (sharedData.addWaypoint(wp)) {
                 count++;
@@ -195,23 +246,22 @@ void WiFiTask::processWaypoints(const JsonArray& waypoints) {
 
 // ========================= Mission protocol handlers =========================
 
-void WiFiTask::processUploadMission() {
-    // Expect mission payload fields: mission_id, waypoints[], parameters{}
+// Shared by upload_mission and the legacy start_mission command: both parse the same
+// payload and leave the mission in PLANNED state, start_mission then auto-starts it
+bool WiFiTask::loadMissionFromJson() {
+    // Expect mission payload fields: mission_id, waypoints[], path_segments[] (optional), parameters{}
     if (!(jsonDoc["mission_id"].is<const char*>() || jsonDoc["mission_id"].is<String>()) ||
         !jsonDoc["waypoints"].is<JsonArray>() ||
         !jsonDoc["parameters"].is<JsonObject>()) {
         sendError("Missing mission fields (mission_id, waypoints, parameters)");
-        return;
+        return false;
     }
 
     // 1) Store mission id
     sharedData.setMissionId(jsonDoc["mission_id"].as<const char*>());
 
-    // 2) Waypoints
-    if (jsonDoc["waypoints"].is<JsonArray>()) {
-        JsonArray waypoints = jsonDoc["waypoints"].as<JsonArray>();
-        processWaypoints(waypoints);
-    }
+    // 2) Waypoints (presence already checked above)
+    processWaypoints(jsonDoc["waypoints"].as<JsonArray>());
 
     // 3) Path segments (optional)
     if (jsonDoc["path_segments"].is<JsonArray>()) {
@@ -248,6 +298,13 @@ void WiFiTask::processUploadMission() {
 
     // 5) Transition to PLANNED state (ready but not started)
     sharedData.setMissionState(MISSION_PLANNED);
+    return true;
+}
+
+void WiFiTask::processUploadMission() {
+    if (!loadMissionFromJson()) {
+        return;
+    }
 
     // NOTE: Do NOT start navigation here - wait for resume_mission command
     Serial.println("[WiFi] Mission uploaded and ready (PLANNED state)");
@@ -255,60 +312,11 @@ void WiFiTask::processUploadMission() {
 }
 
 void WiFiTask::processStartMission() {
-    // Expect mission payload fields: mission_id, waypoints[], path_segments[], parameters{}
-    if (!(jsonDoc["mission_id"].is<const char*>() || jsonDoc["mission_id"].is<String>()) ||
-        !jsonDoc["waypoints"].is<JsonArray>() ||
-        !jsonDoc["parameters"].is<JsonObject>()) {
-        sendError("Missing mission fields (mission_id, waypoints, parameters)");
+    if (!loadMissionFromJson()) {
         return;
     }
 
-    // 1) Store mission id
-    sharedData.setMissionId(jsonDoc["mission_id"].as<const char*>());
-
-    // 2) Waypoints
-    if (jsonDoc["waypoints"].is<JsonArray>()) {
-        JsonArray waypoints = jsonDoc["waypoints"].as<JsonArray>();
-        processWaypoints(waypoints);
-    }
-
-    // 3) Path segments (optional)
-    if (jsonDoc["path_segments"].is<JsonArray>()) {
-        JsonArray segments = jsonDoc["path_segments"].as<JsonArray>();
-        const int maxSeg = min((int)segments.size(), MAX_WAYPOINTS - 1);
-        PathSegment segBuf[MAX_WAYPOINTS - 1];
-        int segCount = 0;
-        for (int i = 0; i < maxSeg; i++) {
-            JsonObject s = segments[i];
-            PathSegment seg;
-            seg.start_lat = s["start_lat"] | 0.0;
-            seg.start_lon = s["start_lon"] | 0.0;
-            seg.end_lat   = s["end_lat"]   | 0.0;
-            seg.end_lon   = s["end_lon"]   | 0.0;
-            seg.distance  = s["distance"]  | 0.0;
-            seg.bearing   = s["bearing"]   | 0.0;
-            seg.speed     = s["speed"]     | 1.0;
-            segBuf[segCount++] = seg;
-        }
-        if (segCount > 0) {
-            sharedData.setPathSegments(segBuf, segCount);
-        }
-    }
-
-    // 4) Mission parameters
-    JsonObject params = jsonDoc["parameters"].as<JsonObject>();
-    MissionParameters mp;
-    mp.speed_mps = params["speed_mps"] | 1.0;
-    mp.cte_threshold_m = params["cte_threshold_m"] | 2.0;
-    mp.mission_timeout_s = params["mission_timeout_s"] | 3600;
-    mp.total_distance_m = params["total_distance_m"] | 0.0;
-    mp.estimated_duration_s = params["estimated_duration_s"] | 0;
-    sharedData.setMissionParameters(mp);
-
-    // 5) Transition to PLANNED state
-    sharedData.setMissionState(MISSION_PLANNED);
-
-    // 6) Auto-start navigation (optional, can be changed to explicit start)
+    // Auto-start navigation (optional, can be changed to explicit start)
     navigationTask.startNavigation();
 
     sendResponse("{\"status\":\"success\",\"message\":\"Mission loaded and started\"}");
@@ -390,10 +398,16 @@ void WiFiTask::processSpeedCommand(int speed) {
 // ============================================================================
 
 void WiFiTask::sendResponse(const String& response) {
+    sendResponse(response.c_str());
+}
+
+void WiFiTask::sendResponse(const char* response) {
     if (clientConnected && client.connected()) {
         client.println(response);
         client.flush();  // Force immediate transmission to prevent race with telemetry
-        Serial.printf("Sent: %s\n", response.c_str());
+        if (ENABLE_COMMAND_DEBUG) {
+            Serial.printf("Sent: %s\n", response);
+        }
     }
 }
 
@@ -481,15 +495,13 @@ void WiFiTask::processManualMove() {
         return;
     }
     
-    String direction = jsonDoc["direction"].as<const char*>();
+    // Points into jsonDoc; no heap String needed on this 20 Hz path
+    const char* direction = jsonDoc["direction"].as<const char*>();
     int speed = jsonDoc["speed"].as<int>();
     
     // Validate direction - support single and combined directions
-    if (direction != "forward" && direction != "backward" && 
-        direction != "left" && direction != "right" && direction != "stop" &&
-        direction != "forward_left" && direction != "forward_right" &&
-        direction != "backward_left" && direction != "backward_right") {
-        sendError("Invalid direction: " + direction);
+    if (!isValidManualDirection(direction)) {
+        sendError(String("Invalid direction: ") + direction);
         return;
     }
     
@@ -499,10 +511,12 @@ void WiFiTask::processManualMove() {
         return;
     }
     
-    Serial.printf("[WiFi] Manual move command: %s at speed %d\n", direction.c_str(), speed);
+    if (ENABLE_COMMAND_DEBUG) {
+        Serial.printf("[WiFi] Manual move command: %s at speed %d\n", direction, speed);
+    }
     
     // IMMEDIATE STOP: Bypass queue for instant motor stop (critical path)
-    if (direction == "stop") {
+    if (strcmp(direction, "stop") == 0) {
         motorController.stopMotors();
         Serial.println("[WiFi] Motors stopped immediately (direct call)");
     }
@@ -511,13 +525,17 @@ void WiFiTask::processManualMove() {
     ManualCommand cmd = {};
     cmd.isControlCmd = false;
     cmd.enableManual = false;
-    strncpy(cmd.direction, direction.c_str(), sizeof(cmd.direction) - 1);
+    strncpy(cmd.direction, direction, sizeof(cmd.direction) - 1);
     cmd.direction[sizeof(cmd.direction) - 1] = '\0';
     cmd.speed = speed;
     
     QueueHandle_t queue = manualControlTask.getCommandQueue();
     if (queue && xQueueSend(queue, &cmd, pdMS_TO_TICKS(10)) == pdTRUE) {
-        String response = "{\"status\":\"success\",\"message\":\"Manual move command: " + direction + " at speed " + String(speed) + "%\"}";
+        // Formatted into a stack buffer instead of chaining String concatenations
+        char response[96];
+        snprintf(response, sizeof(response),
+                 "{\"status\":\"success\",\"message\":\"Manual move command: %s at speed %d%%\"}",
+                 direction, speed);
         sendResponse(response);
     } else {
         sendError("Failed to queue movement command");